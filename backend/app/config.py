@@ -39,6 +39,7 @@ class Settings(BaseSettings):
     MAIL_SERVER: str = "smtp.gmail.com"
     MAIL_TLS: bool = True
     MAIL_SSL: bool = False
+    MAIL_MAX_CONCURRENT_SENDS: int = 16
 
     # Application
     ENVIRONMENT: str = "development"
@@ -46,10 +47,16 @@ class Settings(BaseSettings):
     CORS_ORIGINS: str = "http://localhost:3001,http://localhost:5173"
     FRONTEND_URL: str = "http://localhost:3001"
     PLATFORM_ADMIN_EMAIL: str = "admin@example.com"
+    # Make report generation raise on relationships it did not preload.
+    # For tests and debugging only; never enable in a deployment.
+    REPORT_STRICT_LOADING: bool = False
 
     # File Upload
     MAX_FILE_SIZE: int = 10485760  # 10MB
     UPLOAD_DIR: str = "uploads"
+    # Rendered report chart cache. Kept outside UPLOAD_DIR, which is
+    # served publicly as static files.
+    CHART_CACHE_DIR: str = "chart_cache"
 
     # Platform Limits
     DEFAULT_TENANT_ADMIN_LIMIT: int = 5
@@ -87,7 +87,11 @@ class POC(Base):
     )
     participants = relationship("POCParticipant", back_populates="poc")
     success_criteria = relationship("SuccessCriteria", back_populates="poc")
-    poc_tasks = relationship("POCTask", back_populates="poc")
+    poc_tasks = relationship(
+        "POCTask",
+        back_populates="poc",
+        order_by="[func.coalesce(POCTask.sort_order, 0), POCTask.id]",
+    )
     poc_task_groups = relationship("POCTaskGroup", back_populates="poc")
     comments = relationship("Comment", back_populates="poc")
     resources = relationship(
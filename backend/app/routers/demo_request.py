@@ -154,10 +154,10 @@ async def request_demo_account(
             .all()
         )
 
-        for admin in platform_admins:
+        if platform_admins:
             background_tasks.add_task(
                 send_demo_account_started_email,
-                admin.email,
+                [admin.email for admin in platform_admins],
                 data.name,
                 data.email,
                 data.company_name,
@@ -219,10 +219,10 @@ async def request_demo_account(
         .all()
     )
 
-    for admin in platform_admins:
+    if platform_admins:
         background_tasks.add_task(
             send_demo_account_started_email,
-            admin.email,
+            [admin.email for admin in platform_admins],
             data.name,
             data.email,
             data.company_name,
@@ -503,10 +503,10 @@ async def request_demo_conversion(
         .all()
     )
 
-    for admin in platform_admins:
+    if platform_admins:
         background_tasks.add_task(
             send_demo_conversion_request_email,
-            admin.email,
+            [admin.email for admin in platform_admins],
             current_user.tenant.name,
             current_user.full_name,
             current_user.email,
@@ -770,7 +770,8 @@ def generate_poc_document(
     else:  # markdown
         filename = f"{safe_title}_{timestamp}.md"
         output_path = os.path.join(temp_dir, filename)
-        generator.generate_markdown(output_path)
+        # The file is downloaded on its own, so inline the charts.
+        generator.generate_markdown(output_path, embed_images=True)
         media_type = "text/markdown"
 
     return FileResponse(
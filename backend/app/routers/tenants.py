@@ -3,6 +3,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
 from sqlalchemy.orm import Session
 from typing import List
+from html import escape
 import os
 import uuid
 from pathlib import Path
@@ -405,6 +406,9 @@ async def send_test_email(
 
     # Prepare test email content
     subject = "POC Manager - Test Email"
+    sent_by = (
+        f"{escape(current_user.full_name)} ({escape(current_user.email)})"
+    )
     body = f"""
     <html>
         <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
@@ -413,8 +417,8 @@ async def send_test_email(
             <p>If you received this email, your SMTP configuration is working correctly!</p>
             <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
             <p style="color: #666; font-size: 14px;">
-                <strong>Tenant:</strong> {tenant.name}<br>
-                <strong>Sent by:</strong> {current_user.full_name} ({current_user.email})<br>
+                <strong>Tenant:</strong> {escape(tenant.name)}<br>
+                <strong>Sent by:</strong> {sent_by}<br>
                 <strong>Configuration:</strong> {"Custom SMTP" if tenant.custom_mail_server else "Platform Default"}
             </p>
         </body>
@@ -15,6 +15,7 @@ from reportlab.platypus import (
     Paragraph,
     Spacer,
     Table,
+    LongTable,
     TableStyle,
     PageBreak,
     Image,
@@ -23,42 +24,394 @@ from reportlab.platypus import (
 )
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
-from docx import Document
-from docx.shared import Inches, Pt, RGBColor
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
-import markdown
-from datetime import datetime, date, timedelta
-from typing import Optional, List, Dict, Any
-from collections import defaultdict
-from sqlalchemy.orm import Session
-from app.models.poc import POC, POCParticipant
-from app.models.task import POCTask, POCTaskGroup, POCTaskAssignee
+from datetime import datetime, date
+from typing import Optional, List, Dict, Any, TextIO, Union
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from itertools import chain, islice
+from io import BytesIO
+from PIL import Image as PILImage, UnidentifiedImageError
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from app.config import settings
+from app.models.poc import POC, POCParticipant, POCStatus
+from app.models.task import (
+    POCTask,
+    POCTaskGroup,
+    POCTaskAssignee,
+    TaskGroup,
+    TaskStatus,
+)
 from app.models.comment import Comment
 from app.models.resource import Resource
-from app.models.success_criteria import SuccessCriteria
-from app.utils.chart_generator import (
-    generate_task_status_pie_chart,
-    generate_success_criteria_chart,
-    generate_progress_gauge,
-    generate_timeline_chart,
-    generate_workload_chart,
-    generate_activity_chart,
-    cleanup_chart_files,
-)
+from app.models.success_criteria import SuccessCriteria, TaskSuccessCriteria
 from pathlib import Path
+import base64
+import copy
+import hashlib
+import heapq
+import json
 import os
+import tempfile
+import time
 import logging
+from xml.sax.saxutils import escape as _xml_escape
 
 logger = logging.getLogger(__name__)
 
+# Markdown table row templates, bound once instead of re-parsed per row.
+_MD_CRITERIA_ROW = "| {} | {} | {} | {} | {} | {} |".format
+_MD_PARTICIPANT_ROW = "| {} | {} | {} | {} |".format
+
+# "in_progress" -> "In Progress" for every task, group and POC status.
+# The enums subclass str, so members and raw values both look up here.
+_STATUS_LABELS = {
+    s.value: s.value.replace("_", " ").title()
+    for s in chain(TaskStatus, POCStatus)
+}
+
+# Plain-text status markers for PDF task headings.
+_MARKER = {
+    TaskStatus.NOT_STARTED: "[ ]",
+    TaskStatus.IN_PROGRESS: "[~]",
+    TaskStatus.COMPLETED: "[x]",
+    TaskStatus.BLOCKED: "[!]",
+}
+
+# (badge, label) for Markdown task and group headings, one lookup each.
+_MD_STATUS = {
+    "not_started": ("⚪", "Not Started"),
+    "in_progress": ("🔵", "In Progress"),
+    "completed": ("✅", "Completed"),
+    "blocked": ("🔴", "Blocked"),
+    "satisfied": ("⚪", "Satisfied"),
+    "partially_satisfied": ("⚪", "Partially Satisfied"),
+    "not_satisfied": ("⚪", "Not Satisfied"),
+}
+
+
+def _date_line_templates(start: str, due: str, completed: str) -> tuple:
+    """Task date line templates indexed by the 3-bit presence mask
+    ``has_start << 2 | has_due << 1 | has_completed``."""
+    fields = ((4, start), (2, due), (1, completed))
+    return tuple(
+        " | ".join(f for bit, f in fields if mask & bit) for mask in range(8)
+    )
+
+
+# Filled with (start_date, due_date, completed_at) via str.format.
+_PDF_TASK_DATES = _date_line_templates(
+    "Start: {0}", "Due: {1}", "Completed: {2}"
+)
+_MD_TASK_DATES = _date_line_templates(
+    "**Start:** {0}", "**Due:** {1}", "**Completed:** {2}"
+)
+
+# Participant role label, keyed by (is_sales_engineer, is_customer).
+_ROLE_MAP = {
+    (True, True): "Sales Engineer, Customer",
+    (True, False): "Sales Engineer",
+    (False, True): "Customer",
+    (False, False): "Participant",
+}
+
+
+@lru_cache(maxsize=1024)
+def _fmt_dt(dt: datetime) -> str:
+    """Format a comment timestamp; bulk-imported comments often share one.
+
+    Built from the fields directly, which skips strftime's format parsing.
+    """
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        f" {dt.hour:02d}:{dt.minute:02d}"
+    )
+
+
+# Extra entity for user text placed inside a double-quoted markup attribute.
+_ATTR_ENTITIES = {'"': "&quot;"}
+
+# Page content streams are mostly short text runs; deflating them costs
+# more CPU than the few kilobytes it saves (chart images are compressed
+# independently of this flag).
+PDF_PAGE_COMPRESSION = 0
+
+# Shared stylesheet with the tenant-independent report styles registered
+# once, so generate_pdf only builds the styles that carry tenant colours.
+_STYLES = getSampleStyleSheet()
+_STYLES.add(
+    ParagraphStyle(
+        "CoverSubtitle",
+        parent=_STYLES["Heading2"],
+        fontSize=14,
+        textColor=colors.HexColor("#6B7280"),
+        alignment=TA_CENTER,
+        spaceAfter=6,
+    )
+)
+_STYLES.add(
+    ParagraphStyle(
+        "StatusLine",
+        parent=_STYLES["BodyText"],
+        alignment=TA_CENTER,
+        fontSize=12,
+    )
+)
+_STYLES.add(
+    ParagraphStyle(
+        "DateRange",
+        parent=_STYLES["BodyText"],
+        alignment=TA_CENTER,
+        fontSize=11,
+    )
+)
+_STYLES.add(
+    ParagraphStyle("GenDate", parent=_STYLES["BodyText"], alignment=TA_CENTER)
+)
+_STYLES.add(
+    ParagraphStyle("BodyIndent", parent=_STYLES["BodyText"], leftIndent=20)
+)
+_METRIC_CARD_STYLE = ParagraphStyle("MetricCard", alignment=TA_CENTER)
+_CARD_TMPL = (
+    '<font size="20" color="{color}"><b>{value}</b></font><br/>'
+    '<font size="8" color="#6B7280">{label}</font>'
+)
+
+
+@lru_cache(maxsize=32)
+def _tenant_styles(
+    primary_hex: str, secondary_hex: str
+) -> Dict[str, ParagraphStyle]:
+    """Heading styles in a tenant's colours, built once per colour pair."""
+    primary = colors.HexColor(primary_hex)
+    styles = {
+        "CoverTitle": ParagraphStyle(
+            "CoverTitle",
+            parent=_STYLES["Title"],
+            fontSize=28,
+            textColor=primary,
+            alignment=TA_CENTER,
+            spaceAfter=10,
+        ),
+        "SectionHeading": ParagraphStyle(
+            "SectionHeading",
+            parent=_STYLES["Heading2"],
+            fontSize=16,
+            textColor=primary,
+            spaceBefore=18,
+            spaceAfter=10,
+        ),
+        "SubSection": ParagraphStyle(
+            "SubSection",
+            parent=_STYLES["Heading3"],
+            fontSize=12,
+            textColor=colors.HexColor(secondary_hex),
+            spaceBefore=10,
+            spaceAfter=6,
+        ),
+        "GrpTitle": ParagraphStyle(
+            "GrpTitle",
+            parent=_STYLES["Heading3"],
+            textColor=primary,
+            fontSize=13,
+            spaceBefore=14,
+        ),
+    }
+    for key, left in (("TaskTitle", 0), ("TaskTitleIndent", 20)):
+        styles[key] = ParagraphStyle(
+            "TaskTitleStyle", parent=styles["SubSection"], leftIndent=left
+        )
+    return styles
+
+
+# Fixed PDF table column widths.
+_METRIC_COL_WIDTHS = (1.7 * inch,) * 4
+_CRITERIA_COL_WIDTHS = (
+    0.4 * inch,
+    2.2 * inch,
+    1.2 * inch,
+    1.2 * inch,
+    0.9 * inch,
+    0.5 * inch,
+)
+_PARTICIPANT_COL_WIDTHS = (1.8 * inch, 2.2 * inch, 1.3 * inch, 1 * inch)
+
+# Row labels of the Word "POC Details" table.
+_WORD_DETAIL_LABELS = (
+    "Customer",
+    "Status",
+    "Start Date",
+    "End Date",
+    "Success Score",
+)
+
+# Logos are rendered at most 2 inches wide; 300px covers that at 150 dpi.
+LOGO_MAX_PX = 300
+
+# Rendered chart PNGs, one directory per tenant, keyed by a hash of their
+# inputs so unchanged charts are not redrawn on the next export.
+_CHART_CACHE_DIR = Path(settings.CHART_CACHE_DIR)
+
+# Files kept in each tenant's cache; the least recently used are pruned past
+# this. Files younger than the grace period are kept regardless, since an
+# export in flight may still be reading them by path.
+_CHART_CACHE_MAX_FILES = 500
+_CHART_CACHE_GRACE_SECONDS = 600
+
+# The one thread that draws report charts. matplotlib is not thread-safe
+# and holds the GIL for most of a render, so more workers would add risk
+# without adding throughput. A PDF export still overlaps its chart job
+# with its own remaining DB queries.
+_CHART_POOL = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="report-charts"
+)
+
+
+@lru_cache(maxsize=64)
+def _load_logo_png(path: str, mtime: float) -> bytes:
+    """Decode, downscale and re-encode a logo file as PNG bytes.
+
+    ``mtime`` is part of the cache key so a replaced upload is re-read.
+    """
+    with PILImage.open(path) as img:
+        img.thumbnail((LOGO_MAX_PX, LOGO_MAX_PX))
+        if img.mode not in ("1", "L", "LA", "P", "RGB", "RGBA"):
+            img = img.convert("RGBA")
+        buf = BytesIO()
+        img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _chart_cache_dir(tenant_id: Optional[int]) -> Path:
+    """The tenant's chart cache directory, private to this process's user.
+
+    Cached PNGs are embedded into reports as-is, so a cache root another
+    user could write to is refused rather than trusted.
+    """
+    _CHART_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = _CHART_CACHE_DIR.stat()
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise PermissionError(
+            f"Chart cache {_CHART_CACHE_DIR} must be owned by this user "
+            "with mode 0700"
+        )
+    path = _CHART_CACHE_DIR / str(tenant_id)
+    path.mkdir(mode=0o700, exist_ok=True)
+    return path
+
+
+def _write_chart_cache(path: Path, data: bytes) -> None:
+    """Store a rendered chart in its cache directory.
+
+    Written then renamed so concurrent readers never see a partial PNG.
+    """
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, suffix=".tmp", delete=False
+    ) as tmp:
+        tmp.write(data)
+    os.replace(tmp.name, path)
+    _prune_chart_cache(path.parent)
+
+
+def _prune_chart_cache(cache_dir: Path) -> None:
+    """Delete the least recently used charts past _CHART_CACHE_MAX_FILES."""
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                continue
+    excess = len(entries) - _CHART_CACHE_MAX_FILES
+    if excess <= 0:
+        return
+    cutoff = time.time() - _CHART_CACHE_GRACE_SECONDS
+    for mtime, path in heapq.nsmallest(excess, entries):
+        if mtime >= cutoff:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _quantize_png(data: bytes, colors: int = 64) -> bytes:
+    """Re-encode an opaque chart PNG with an adaptive palette.
+
+    The charts are flat colours on a solid background, so 64 colours look
+    the same at roughly a third of the bytes.
+    """
+    with PILImage.open(BytesIO(data)) as img:
+        img = img.convert("RGB").convert(
+            "P", palette=PILImage.Palette.ADAPTIVE, colors=colors
+        )
+        buf = BytesIO()
+        img.save(buf, format="PNG", optimize=True)
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=1)
+def _word_template_bytes() -> bytes:
+    """Serialized python-docx default template, read from disk once."""
+    from docx import Document
+
+    buf = BytesIO()
+    Document().save(buf)
+    return buf.getvalue()
+
+
+def _add_word_table(doc, rows, style: str):
+    """Append a table of plain-text ``rows`` to a python-docx document.
+
+    Each ``<w:tr>`` is cloned from one empty template row and filled at the
+    XML level, instead of assigning ``table.rows[i].cells[j].text``, which
+    rebuilds the cell grid on every access.
+    """
+    table = doc.add_table(rows=1, cols=len(rows[0]))
+    table.style = style
+    tbl = table._tbl
+    template = tbl.tr_lst[0]
+    for values in rows:
+        tr = copy.deepcopy(template)
+        for tc, value in zip(tr.tc_lst, values):
+            tc.p_lst[0].add_r().text = value
+        tbl.append(tr)
+    tbl.remove(template)
+    return table
+
 
 class DocumentGenerator:
     """Enhanced POC document generator with charts and comprehensive metrics."""
 
     def __init__(self, db: Session, poc: POC):
         self.db = db
-        self.poc = poc
-        self.tenant = poc.tenant
+        # Load every collection the report walks in one pass, so each
+        # relationship costs one SELECT instead of a lazy load per row.
+        query = db.query(POC).options(
+            joinedload(POC.tenant),
+            selectinload(POC.success_criteria),
+            selectinload(POC.resources),
+            selectinload(POC.products),
+            selectinload(POC.participants).joinedload(POCParticipant.user),
+            selectinload(POC.poc_tasks)
+            .selectinload(POCTask.assignees)
+            .joinedload(POCTaskAssignee.participant)
+            .joinedload(POCParticipant.user),
+            selectinload(POC.poc_tasks)
+            .selectinload(POCTask.task_criteria)
+            .joinedload(TaskSuccessCriteria.success_criteria),
+            selectinload(POC.poc_tasks).selectinload(POCTask.resources),
+            selectinload(POC.poc_task_groups),
+            selectinload(POC.comments).joinedload(Comment.user),
+        )
+        if settings.REPORT_STRICT_LOADING:
+            # Any relationship the report touches without loading it here
+            # raises instead of silently issuing one query per row.
+            query = query.options(raiseload("*"))
+        self.poc = query.filter(POC.id == poc.id).one()
+        self.tenant = self.poc.tenant
         self._primary_hex = (
             self.tenant.primary_color
             if self.tenant and self.tenant.primary_color
@@ -72,93 +425,216 @@ class DocumentGenerator:
         self.primary_color = colors.HexColor(self._primary_hex)
         self.secondary_color = colors.HexColor(self._secondary_hex)
 
+        # Cover-page strings, formatted once per report.
+        self._start_str = (
+            self.poc.start_date.isoformat() if self.poc.start_date else "TBD"
+        )
+        self._end_str = (
+            self.poc.end_date.isoformat() if self.poc.end_date else "TBD"
+        )
+        self._generated_str = datetime.now().strftime("%B %d, %Y at %H:%M")
+
+        # Opening tag of every Markdown section heading, in tenant colour.
+        self._h2_open = f'<h2 style="color: {self._primary_hex};">'
+
         # Caches
         self._all_tasks: Optional[List[POCTask]] = None
         self._all_task_groups: Optional[List[POCTaskGroup]] = None
         self._all_comments: Optional[List[Comment]] = None
+        self._participants: Optional[List[POCParticipant]] = None
+        self._name_by_participant_id: Dict[int, str] = {}
+        self._author_names: Dict[int, str] = {}
+        self._group_task_index: Optional[Dict[int, List[POCTask]]] = None
+        self._resources_by_group: Optional[Dict[int, List[Resource]]] = None
+        self._comments_by_group: Optional[Dict[int, List[Comment]]] = None
+        self._comments_by_task: Optional[Dict[int, List[Comment]]] = None
         self._metrics: Optional[Dict[str, Any]] = None
-        self._chart_files: List[str] = []
 
     # ------------------------------------------------------------------ #
     #  Data helpers                                                        #
     # ------------------------------------------------------------------ #
 
+    def _prime(self) -> None:
+        """Index the collections loaded in __init__ for the report walk."""
+        if self._all_tasks is not None:
+            return
+        poc = self.poc
+        self._participants = list(poc.participants)
+        self._name_by_participant_id = {
+            p.id: p.user.full_name or p.user.email
+            for p in self._participants
+            if p.user
+        }
+        self._all_task_groups = sorted(
+            poc.poc_task_groups, key=lambda g: g.sort_order or 0
+        )
+        self._all_comments = sorted(
+            poc.comments,
+            key=lambda c: c.created_at or datetime.min,
+            reverse=True,
+        )
+        # POC.poc_tasks is ordered by sort_order in SQL.
+        self._all_tasks = list(poc.poc_tasks)
+
     def _get_all_tasks(self) -> List[POCTask]:
-        if self._all_tasks is None:
-            self._all_tasks = (
-                self.db.query(POCTask)
-                .filter(POCTask.poc_id == self.poc.id)
-                .order_by(POCTask.sort_order)
-                .all()
-            )
+        self._prime()
         return self._all_tasks
 
     def _get_all_task_groups(self) -> List[POCTaskGroup]:
-        if self._all_task_groups is None:
-            self._all_task_groups = (
-                self.db.query(POCTaskGroup)
-                .filter(POCTaskGroup.poc_id == self.poc.id)
-                .order_by(POCTaskGroup.sort_order)
-                .all()
-            )
+        self._prime()
         return self._all_task_groups
 
     def _get_all_comments(self) -> List[Comment]:
-        if self._all_comments is None:
-            self._all_comments = (
-                self.db.query(Comment)
-                .filter(Comment.poc_id == self.poc.id)
-                .order_by(Comment.created_at.desc())
-                .all()
-            )
+        self._prime()
         return self._all_comments
 
-    def _get_participants(self) -> List[POCParticipant]:
-        return (
-            self.db.query(POCParticipant)
-            .filter(POCParticipant.poc_id == self.poc.id)
-            .all()
+    def _get_poc_comments(self, limit: int = 10) -> List[Comment]:
+        """Latest ``limit`` POC-level comments, oldest first.
+
+        Taken from the primed comments, whose authors are already loaded,
+        rather than from a fresh query.
+        """
+        poc_level = (
+            c
+            for c in self._get_all_comments()
+            if c.poc_task_id is None and c.poc_task_group_id is None
         )
+        latest = list(islice(poc_level, limit))
+        latest.reverse()
+        return latest
+
+    def _get_participants(self) -> List[POCParticipant]:
+        self._prime()
+        return self._participants
+
+    def _participant_rows(self) -> List[List[str]]:
+        """[name, email, role, joined] for each participant with a user."""
+        return [
+            [
+                p.user.full_name or p.user.email,
+                p.user.email,
+                _ROLE_MAP[bool(p.is_sales_engineer), bool(p.is_customer)],
+                p.joined_at.strftime("%Y-%m-%d") if p.joined_at else "N/A",
+            ]
+            for p in self._get_participants()
+            if p.user
+        ]
 
     def _get_poc_resources(self) -> List[Resource]:
-        return (
-            self.db.query(Resource)
-            .filter(
-                Resource.poc_id == self.poc.id,
-                Resource.poc_task_id.is_(None),
-                Resource.poc_task_group_id.is_(None),
-            )
-            .all()
-        )
+        return [
+            r
+            for r in self.poc.resources
+            if r.poc_task_id is None and r.poc_task_group_id is None
+        ]
+
+    def _build_group_task_index(self) -> Dict[int, List[POCTask]]:
+        """Map each POC task group id to its POC tasks, in sort order."""
+        groups = self._get_all_task_groups()
+        template_ids = {g.task_group_id for g in groups if g.task_group_id}
+        if not template_ids:
+            return {}
+        template_task_ids = {
+            tg.id: {t.id for t in tg.tasks}
+            for tg in self.db.query(TaskGroup)
+            .options(selectinload(TaskGroup.tasks))
+            .filter(TaskGroup.id.in_(template_ids))
+        }
+        tasks = self._get_all_tasks()
+        index: Dict[int, List[POCTask]] = {}
+        for g in groups:
+            task_ids = template_task_ids.get(g.task_group_id)
+            if task_ids:
+                index[g.id] = [t for t in tasks if t.task_id in task_ids]
+        return index
 
     def _get_group_tasks(self, group: POCTaskGroup) -> List[POCTask]:
         """Get POC tasks belonging to a task group."""
-        if group.task_group_id:
-            from app.models.task import TaskGroup
-
-            template_group = (
-                self.db.query(TaskGroup)
-                .filter(TaskGroup.id == group.task_group_id)
-                .first()
+        if self._group_task_index is None:
+            self._group_task_index = self._build_group_task_index()
+        return self._group_task_index.get(group.id, [])
+
+    def _prefetch_group_children(self) -> None:
+        """Bulk-load resources and comments for every task group."""
+        group_ids = [g.id for g in self._get_all_task_groups()]
+        self._resources_by_group = defaultdict(list)
+        self._comments_by_group = self._latest_comments_by(
+            Comment.poc_task_group_id, group_ids
+        )
+        if not group_ids:
+            return
+        for r in self.db.query(Resource).filter(
+            Resource.poc_task_group_id.in_(group_ids)
+        ):
+            self._resources_by_group[r.poc_task_group_id].append(r)
+
+    def _get_group_resources(self, group: POCTaskGroup) -> List[Resource]:
+        if self._resources_by_group is None:
+            self._prefetch_group_children()
+        return self._resources_by_group.get(group.id, [])
+
+    def _get_group_comments(self, group: POCTaskGroup) -> List[Comment]:
+        """Latest comments on a group, oldest first."""
+        if self._comments_by_group is None:
+            self._prefetch_group_children()
+        return self._comments_by_group.get(group.id, [])
+
+    def _get_task_comments(self, task: POCTask) -> List[Comment]:
+        """Latest comments on a task, oldest first."""
+        if self._comments_by_task is None:
+            self._comments_by_task = self._latest_comments_by(
+                Comment.poc_task_id, [t.id for t in self._get_all_tasks()]
             )
-            if template_group and template_group.tasks:
-                template_task_ids = [t.id for t in template_group.tasks]
-                return (
-                    self.db.query(POCTask)
-                    .filter(
-                        POCTask.poc_id == self.poc.id,
-                        POCTask.task_id.in_(template_task_ids),
-                    )
-                    .order_by(POCTask.sort_order)
-                    .all()
+        return self._comments_by_task.get(task.id, [])
+
+    def _latest_comments_by(
+        self, parent_col, parent_ids: List[int], limit: int = 5
+    ) -> Dict[int, List[Comment]]:
+        """Latest ``limit`` comments per parent id, oldest first.
+
+        One query for every parent: comments are ranked newest first
+        within each parent and only the top ``limit`` rows are loaded.
+        """
+        by_parent: Dict[int, List[Comment]] = defaultdict(list)
+        if not parent_ids:
+            return by_parent
+        ranked = (
+            select(
+                Comment.id,
+                func.row_number()
+                .over(
+                    partition_by=parent_col,
+                    order_by=Comment.created_at.desc(),
                 )
-        return []
+                .label("rn"),
+            )
+            .where(parent_col.in_(parent_ids))
+            .subquery()
+        )
+        rows = (
+            self.db.query(Comment)
+            .options(joinedload(Comment.user))
+            .join(ranked, ranked.c.id == Comment.id)
+            .filter(ranked.c.rn <= limit)
+            .order_by(parent_col, Comment.created_at)
+        )
+        for c in rows:
+            by_parent[getattr(c, parent_col.key)].append(c)
+        return by_parent
 
     @staticmethod
-    def _comment_author_name(comment: Comment) -> str:
+    def _as_date(value):
+        """Normalize a date or datetime column value to a date."""
+        return value.date() if isinstance(value, datetime) else value
+
+    def _comment_author_name(self, comment: Comment) -> str:
         """Safely get the display name for a comment author."""
+        name = self._author_names.get(comment.user_id)
+        if name is not None:
+            return name
         if comment.user:
-            return comment.user.full_name or comment.user.email
+            name = comment.user.full_name or comment.user.email
+            self._author_names[comment.user_id] = name
+            return name
         if comment.guest_name:
             return f"{comment.guest_name} (guest)"
         return "Unknown"
@@ -167,20 +643,32 @@ class DocumentGenerator:
     #  Metrics computation                                                 #
     # ------------------------------------------------------------------ #
 
+    def _poc_day_counts(self):
+        """Return (total, elapsed, remaining) days of the POC window."""
+        if not (self.poc.start_date and self.poc.end_date):
+            return None, None, None
+        today = date.today()
+        start = self._as_date(self.poc.start_date)
+        end = self._as_date(self.poc.end_date)
+        return (
+            (end - start).days or 1,
+            max(0, (today - start).days),
+            max(0, (end - today).days),
+        )
+
     def _compute_metrics(self) -> Dict[str, Any]:
         """Pre-compute all report metrics."""
         if self._metrics is not None:
             return self._metrics
 
+        self._prime()
         tasks = self._get_all_tasks()
         groups = self._get_all_task_groups()
         comments = self._get_all_comments()
         participants = self._get_participants()
 
         # Task status counts
-        status_counts: Dict[str, int] = defaultdict(int)
-        for t in tasks:
-            status_counts[t.status.value] += 1
+        status_counts = Counter(t.status.value for t in tasks)
         total_tasks = len(tasks)
         completed_tasks = status_counts.get("completed", 0)
         completion_pct = (
@@ -188,10 +676,9 @@ class DocumentGenerator:
         )
 
         # Task group status counts
-        group_status_counts: Dict[str, int] = defaultdict(int)
-        for g in groups:
-            val = g.status.value if g.status else "not_started"
-            group_status_counts[val] += 1
+        group_status_counts = Counter(
+            g.status.value if g.status else "not_started" for g in groups
+        )
 
         # Success criteria
         criteria = self.poc.success_criteria or []
@@ -215,118 +702,52 @@ class DocumentGenerator:
         ]
 
         # Timeline
-        days_total = None
-        days_elapsed = None
-        days_remaining = None
-        if self.poc.start_date and self.poc.end_date:
-            today = date.today()
-            start = (
-                self.poc.start_date.date()
-                if isinstance(self.poc.start_date, datetime)
-                else self.poc.start_date
-            )
-            end = (
-                self.poc.end_date.date()
-                if isinstance(self.poc.end_date, datetime)
-                else self.poc.end_date
-            )
-            days_total = (end - start).days or 1
-            days_elapsed = max(0, (today - start).days)
-            days_remaining = max(0, (end - today).days)
+        days_total, days_elapsed, days_remaining = self._poc_day_counts()
 
         # Workload per assignee
-        assignee_workload: Dict[str, Dict[str, int]] = {}
+        names = self._name_by_participant_id
+        workload: Counter = Counter()
         for task in tasks:
-            assignees = (
-                self.db.query(POCTaskAssignee)
-                .filter(POCTaskAssignee.poc_task_id == task.id)
-                .all()
-            )
-            for a in assignees:
-                if a.participant and a.participant.user:
-                    name = (
-                        a.participant.user.full_name
-                        or a.participant.user.email
-                    )
-                    if name not in assignee_workload:
-                        assignee_workload[name] = defaultdict(int)
-                    assignee_workload[name][task.status.value] += 1
+            for a in task.assignees:
+                name = names.get(a.participant_id)
+                if name:
+                    workload[(name, task.status.value)] += 1
+        assignee_workload: Dict[str, Dict[str, int]] = {}
+        for (name, status), n in workload.items():
+            assignee_workload.setdefault(name, {})[status] = n
 
         # Activity over time (comments grouped by week)
         activity_data: List[Dict[str, Any]] = []
         if comments:
-            week_counts: Dict[str, int] = defaultdict(int)
-            for c in comments:
-                week_start = c.created_at - timedelta(
-                    days=c.created_at.weekday()
-                )
-                key = week_start.strftime("%b %d")
-                week_counts[key] += 1
-            # Sort by actual date and take last 12 weeks
-            sorted_weeks = sorted(
-                week_counts.items(),
-                key=lambda x: datetime.strptime(
-                    x[0] + f" {datetime.now().year}", "%b %d %Y"
-                ),
+            days = np.array(
+                [c.created_at.date() for c in comments], dtype="datetime64[D]"
+            )
+            # 1970-01-01 was a Thursday; shift by 3 so weeks start Monday.
+            weekday = (days.view("int64") + 3) % 7
+            weeks, counts = np.unique(
+                days - weekday.astype("timedelta64[D]"), return_counts=True
             )
+            # np.unique returns the weeks sorted; keep the last 12.
             activity_data = [
-                {"period": k, "count": v} for k, v in sorted_weeks[-12:]
+                {"period": week.item().strftime("%b %d"), "count": int(n)}
+                for week, n in zip(weeks[-12:], counts[-12:])
             ]
 
         # Timeline chart data
-        timeline_items = []
-        for g in groups:
-            start_d = None
-            end_d = None
-            if hasattr(g, "start_date") and g.start_date:
-                start_d = (
-                    g.start_date.date()
-                    if isinstance(g.start_date, datetime)
-                    else g.start_date
-                )
-            if hasattr(g, "due_date") and g.due_date:
-                end_d = (
-                    g.due_date.date()
-                    if isinstance(g.due_date, datetime)
-                    else g.due_date
-                )
-            if start_d or end_d:
-                timeline_items.append(
-                    {
-                        "title": g.title,
-                        "start_date": start_d,
-                        "due_date": end_d,
-                        "status": (
-                            g.status.value if g.status else "not_started"
-                        ),
-                        "is_group": True,
-                    }
-                )
-        for t in tasks:
-            start_d = None
-            end_d = None
-            if t.start_date:
-                start_d = (
-                    t.start_date.date()
-                    if isinstance(t.start_date, datetime)
-                    else t.start_date
-                )
-            if t.due_date:
-                end_d = (
-                    t.due_date.date()
-                    if isinstance(t.due_date, datetime)
-                    else t.due_date
-                )
-            if start_d or end_d:
-                timeline_items.append(
-                    {
-                        "title": t.title,
-                        "start_date": start_d,
-                        "due_date": end_d,
-                        "status": t.status.value,
-                        "is_group": False,
-                    }
-                )
+        as_date = self._as_date
+        timeline_items = [
+            {
+                "title": x.title,
+                "start_date": as_date(x.start_date),
+                "due_date": as_date(x.due_date),
+                "status": x.status.value if x.status else "not_started",
+                "is_group": is_group,
+            }
+            for x, is_group in chain(
+                ((g, True) for g in groups), ((t, False) for t in tasks)
+            )
+            if x.start_date or x.due_date
+        ]
 
         self._metrics = {
             "total_tasks": total_tasks,
@@ -351,99 +772,117 @@ class DocumentGenerator:
         }
         return self._metrics
 
-    # ------------------------------------------------------------------ #
-    #  Chart generation                                                    #
-    # ------------------------------------------------------------------ #
-
-    def _generate_charts(
-        self, as_base64: bool = False
-    ) -> Dict[str, Optional[str]]:
-        """Generate all charts and return paths/data URIs."""
-        m = self._compute_metrics()
-        charts: Dict[str, Optional[str]] = {}
-
-        try:
-            charts["progress_gauge"] = generate_progress_gauge(
-                m["completion_pct"],
-                self.poc.overall_success_score,
-                self._primary_hex,
-                as_base64,
-            )
-        except Exception as e:
-            logger.warning("Failed to generate progress gauge: %s", e)
-            charts["progress_gauge"] = None
-
+    def _render_cached_chart(
+        self, name: str, fn, args: tuple, as_base64: bool, as_path: bool
+    ) -> Optional[Union[str, BytesIO]]:
+        """Render a chart once per distinct input, reusing the cached PNG.
+
+        Returns the cached file's path when ``as_path`` is set, a data URI
+        when ``as_base64`` is set, and an in-memory PNG otherwise.
+        """
+        inputs = [name, args, self._primary_hex]
+        if name == "timeline":
+            # The timeline draws a "today" marker.
+            inputs.append(date.today())
+        key = hashlib.blake2b(
+            json.dumps(inputs, default=str, sort_keys=True).encode(),
+            digest_size=16,
+        ).hexdigest()
+        cache_dir = _chart_cache_dir(self.poc.tenant_id)
+        path = cache_dir / f"{key}.png"
         try:
-            charts["task_status"] = generate_task_status_pie_chart(
-                m["status_counts"],
-                self._primary_hex,
-                as_base64,
-            )
-        except Exception as e:
-            logger.warning("Failed to generate task status chart: %s", e)
-            charts["task_status"] = None
+            data = path.read_bytes()
+            # Mark as recently used so pruning keeps it.
+            os.utime(path)
+        except FileNotFoundError:
+            rendered = fn(*args, self._primary_hex, False, True)
+            if rendered is None:
+                return None
+            data = rendered.getvalue()
+            _write_chart_cache(path, data)
+        if as_path:
+            return str(path)
+        if as_base64:
+            # Inlined charts dominate the Markdown size, so they get a
+            # palette re-encode, cached beside the full-colour PNG.
+            small = cache_dir / f"{key}.p64.png"
+            try:
+                data = small.read_bytes()
+                os.utime(small)
+            except FileNotFoundError:
+                data = _quantize_png(data)
+                _write_chart_cache(small, data)
+            encoded = base64.b64encode(data).decode("utf-8")
+            return f"data:image/png;base64,{encoded}"
+        return BytesIO(data)
 
-        try:
-            charts["success_criteria"] = generate_success_criteria_chart(
-                m["criteria_data"],
-                self._primary_hex,
-                as_base64,
-            )
-        except Exception as e:
-            logger.warning("Failed to generate success criteria chart: %s", e)
-            charts["success_criteria"] = None
-
-        poc_start = None
-        poc_end = None
-        if self.poc.start_date:
-            poc_start = (
-                self.poc.start_date.date()
-                if isinstance(self.poc.start_date, datetime)
-                else self.poc.start_date
-            )
-        if self.poc.end_date:
-            poc_end = (
-                self.poc.end_date.date()
-                if isinstance(self.poc.end_date, datetime)
-                else self.poc.end_date
-            )
-
-        try:
-            charts["timeline"] = generate_timeline_chart(
-                m["timeline_items"],
-                poc_start,
-                poc_end,
-                self._primary_hex,
-                as_base64,
-            )
-        except Exception as e:
-            logger.warning("Failed to generate timeline chart: %s", e)
-            charts["timeline"] = None
+    def _generate_charts(
+        self, as_base64: bool = False, as_path: bool = False
+    ) -> Dict[str, Optional[Union[str, BytesIO]]]:
+        """Generate all charts as in-memory PNGs, data URIs or file paths."""
+        # matplotlib is slow to import; only pay for it when rendering.
+        from app.utils.chart_generator import (
+            generate_task_status_pie_chart,
+            generate_success_criteria_chart,
+            generate_progress_gauge,
+            generate_timeline_chart,
+            generate_workload_chart,
+            generate_activity_chart,
+        )
 
-        try:
-            charts["workload"] = generate_workload_chart(
-                m["assignee_workload"],
-                self._primary_hex,
-                as_base64,
-            )
-        except Exception as e:
-            logger.warning("Failed to generate workload chart: %s", e)
-            charts["workload"] = None
+        m = self._compute_metrics()
+        charts: Dict[str, Optional[Union[str, BytesIO]]] = {}
 
-        try:
-            charts["activity"] = generate_activity_chart(
-                m["activity_data"],
-                self._primary_hex,
-                as_base64,
-            )
-        except Exception as e:
-            logger.warning("Failed to generate activity chart: %s", e)
-            charts["activity"] = None
+        poc_start = self._as_date(self.poc.start_date)
+        poc_end = self._as_date(self.poc.end_date)
 
-        # Track file paths for cleanup
-        for v in charts.values():
-            if v and not v.startswith("data:"):
-                self._chart_files.append(v)
+        jobs = {
+            "progress_gauge": (
+                generate_progress_gauge,
+                (m["completion_pct"], self.poc.overall_success_score),
+            ),
+            "task_status": (
+                generate_task_status_pie_chart,
+                (m["status_counts"],),
+            ),
+            "success_criteria": (
+                generate_success_criteria_chart,
+                (m["criteria_data"],),
+            ),
+            "timeline": (
+                generate_timeline_chart,
+                (m["timeline_items"], poc_start, poc_end),
+            ),
+            "workload": (generate_workload_chart, (m["assignee_workload"],)),
+            "activity": (generate_activity_chart, (m["activity_data"],)),
+        }
+        # Skip charts whose section would be empty instead of rendering
+        # them only to discard the result.
+        empty = {
+            "success_criteria": not m["criteria_total"],
+            "timeline": not m["timeline_items"],
+            "workload": not m["assignee_workload"],
+            "activity": not m["activity_data"],
+        }
+        for name, is_empty in empty.items():
+            if is_empty:
+                del jobs[name]
+                charts[name] = None
+
+        # One at a time: matplotlib shares its font cache and text layout
+        # state between figures, so concurrent rendering is not safe.
+        for name, (fn, args) in jobs.items():
+            try:
+                charts[name] = self._render_cached_chart(
+                    name, fn, args, as_base64, as_path
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to generate %s chart: %s",
+                    name.replace("_", " "),
+                    e,
+                )
+                charts[name] = None
 
         return charts
 
@@ -451,819 +890,603 @@ class DocumentGenerator:
     #  PDF Generation                                                      #
     # ------------------------------------------------------------------ #
 
-    def generate_pdf(self, output_path: str):
-        """Generate a comprehensive PDF report with charts."""
-        m = self._compute_metrics()
-        charts = self._generate_charts(as_base64=False)
+    def _section_hr(self) -> HRFlowable:
+        # A fresh rule per section: Platypus tags a flowable it pushes to
+        # the next frame with _postponed and never clears it, so a shared
+        # instance raises LayoutError the second time it lands at a frame
+        # bottom.
+        return HRFlowable(
+            width="100%",
+            thickness=1,
+            color=self.primary_color,
+            spaceAfter=10,
+        )
 
-        try:
-            doc = SimpleDocTemplate(
-                output_path,
-                pagesize=letter,
-                leftMargin=0.75 * inch,
-                rightMargin=0.75 * inch,
-                topMargin=0.6 * inch,
-                bottomMargin=0.6 * inch,
-            )
-            styles = getSampleStyleSheet()
-            story = []
-
-            # --- Custom styles ---
-            title_style = ParagraphStyle(
-                "CoverTitle",
-                parent=styles["Title"],
-                fontSize=28,
-                textColor=self.primary_color,
-                alignment=TA_CENTER,
-                spaceAfter=10,
-            )
-            subtitle_style = ParagraphStyle(
-                "CoverSubtitle",
-                parent=styles["Heading2"],
-                fontSize=14,
-                textColor=colors.HexColor("#6B7280"),
-                alignment=TA_CENTER,
-                spaceAfter=6,
-            )
-            section_style = ParagraphStyle(
-                "SectionHeading",
-                parent=styles["Heading2"],
-                fontSize=16,
-                textColor=self.primary_color,
-                spaceBefore=18,
-                spaceAfter=10,
-            )
-            subsection_style = ParagraphStyle(
-                "SubSection",
-                parent=styles["Heading3"],
-                fontSize=12,
-                textColor=self.secondary_color,
-                spaceBefore=10,
-                spaceAfter=6,
-            )
-            body_style = styles["BodyText"]
-            body_indent = ParagraphStyle(
-                "BodyIndent",
-                parent=body_style,
-                leftIndent=20,
-            )
+    @cached_property
+    def _criteria_table_style(self) -> TableStyle:
+        return TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, 0), self.primary_color),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                ("FONTSIZE", (0, 0), (-1, -1), 9),
+                ("ALIGN", (0, 0), (0, -1), "CENTER"),
+                ("ALIGN", (4, 0), (5, -1), "CENTER"),
+                ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+                ("TOPPADDING", (0, 0), (-1, -1), 6),
+                ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#E5E7EB")),
+                (
+                    "ROWBACKGROUNDS",
+                    (0, 1),
+                    (-1, -1),
+                    [colors.white, colors.HexColor("#F9FAFB")],
+                ),
+            ]
+        )
 
-            # =============================================
-            #  COVER PAGE
-            # =============================================
-            story.append(Spacer(1, 1.2 * inch))
-
-            # Customer logo
-            if self.poc.customer_logo_url:
-                logo_path = self._get_logo_path(self.poc.customer_logo_url)
-                if logo_path and os.path.exists(logo_path):
-                    try:
-                        logo = Image(
-                            logo_path,
-                            width=2 * inch,
-                            height=2 * inch,
-                            kind="proportional",
-                        )
-                        logo.hAlign = "CENTER"
-                        story.append(logo)
-                        story.append(Spacer(1, 0.3 * inch))
-                    except Exception:
-                        pass
+    @cached_property
+    def _participants_table_style(self) -> TableStyle:
+        return TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, 0), self.primary_color),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                ("FONTSIZE", (0, 0), (-1, -1), 9),
+                ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+                ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#E5E7EB")),
+                (
+                    "ROWBACKGROUNDS",
+                    (0, 1),
+                    (-1, -1),
+                    [colors.white, colors.HexColor("#F9FAFB")],
+                ),
+            ]
+        )
 
-            # Customer company name
-            story.append(
-                Paragraph(self.poc.customer_company_name, subtitle_style)
-            )
-            story.append(Spacer(1, 0.2 * inch))
+    def generate_pdf(self, output_path: str):
+        """Generate a comprehensive PDF report with charts."""
+        Path(output_path).write_bytes(self.generate_pdf_bytes())
+        return output_path
 
-            # POC Title
-            story.append(Paragraph(self.poc.title, title_style))
-            story.append(Spacer(1, 0.15 * inch))
+    def generate_pdf_bytes(self) -> bytes:
+        """Render the PDF report in memory and return its bytes."""
+        poc = self.poc
+        m = self._compute_metrics()
+        # Charts only read the metrics computed above, so they can render
+        # while this thread runs the remaining task group queries. The
+        # session itself is never touched from the pool.
+        charts_future = _CHART_POOL.submit(self._generate_charts)
+        if self._group_task_index is None:
+            self._group_task_index = self._build_group_task_index()
+        if self._resources_by_group is None:
+            self._prefetch_group_children()
+        charts = charts_future.result()
+        buf = BytesIO()
+
+        doc = SimpleDocTemplate(
+            buf,
+            pagesize=letter,
+            pageCompression=PDF_PAGE_COMPRESSION,
+            leftMargin=0.75 * inch,
+            rightMargin=0.75 * inch,
+            topMargin=0.6 * inch,
+            bottomMargin=0.6 * inch,
+        )
+        styles = _STYLES
+        story = []
+
+        # --- Custom styles ---
+        tenant_styles = _tenant_styles(self._primary_hex, self._secondary_hex)
+        title_style = tenant_styles["CoverTitle"]
+        subtitle_style = styles["CoverSubtitle"]
+        section_style = tenant_styles["SectionHeading"]
+        subsection_style = tenant_styles["SubSection"]
+        body_style = styles["BodyText"]
+        body_indent = styles["BodyIndent"]
 
-            # Status badge
-            status_text = self.poc.status.value.replace("_", " ").title()
-            story.append(
-                Paragraph(
-                    f'<font color="#6B7280">Status:</font> <b>{status_text}</b>',
-                    ParagraphStyle(
-                        "StatusLine",
-                        parent=body_style,
-                        alignment=TA_CENTER,
-                        fontSize=12,
-                    ),
+        # =============================================
+        #  COVER PAGE
+        # =============================================
+        story.append(Spacer(1, 1.2 * inch))
+
+        # Customer logo
+        logo_bytes = self._get_logo_bytes()
+        if logo_bytes:
+            try:
+                logo = Image(
+                    BytesIO(logo_bytes),
+                    width=2 * inch,
+                    height=2 * inch,
+                    kind="proportional",
                 )
+                logo.hAlign = "CENTER"
+                story.append(logo)
+                story.append(Spacer(1, 0.3 * inch))
+            except Exception:
+                pass
+
+        # Customer company name
+        story.append(
+            Paragraph(_xml_escape(poc.customer_company_name), subtitle_style)
+        )
+        story.append(Spacer(1, 0.2 * inch))
+
+        # POC Title
+        story.append(Paragraph(_xml_escape(poc.title), title_style))
+        story.append(Spacer(1, 0.15 * inch))
+
+        # Status badge
+        status_text = _STATUS_LABELS[poc.status.value]
+        story.append(
+            Paragraph(
+                f'<font color="#6B7280">Status:</font> <b>{status_text}</b>',
+                styles["StatusLine"],
             )
+        )
 
-            # Date range
-            start_str = (
-                str(self.poc.start_date) if self.poc.start_date else "TBD"
+        # Date range
+        start_str, end_str = self._start_str, self._end_str
+        story.append(
+            Paragraph(
+                f'<font color="#6B7280">{start_str}  &mdash;  {end_str}</font>',
+                styles["DateRange"],
             )
-            end_str = str(self.poc.end_date) if self.poc.end_date else "TBD"
-            story.append(
-                Paragraph(
-                    f'<font color="#6B7280">{start_str}  &mdash;  {end_str}</font>',
-                    ParagraphStyle(
-                        "DateRange",
-                        parent=body_style,
-                        alignment=TA_CENTER,
-                        fontSize=11,
-                    ),
-                )
+        )
+        story.append(Spacer(1, 0.3 * inch))
+
+        # Generation timestamp
+        story.append(
+            Paragraph(
+                f'<font color="#9CA3AF" size="9">Generated on '
+                f"{self._generated_str}</font>",
+                styles["GenDate"],
             )
-            story.append(Spacer(1, 0.3 * inch))
+        )
+        story.append(PageBreak())
 
-            # Generation timestamp
-            story.append(
-                Paragraph(
-                    f'<font color="#9CA3AF" size="9">Generated on '
-                    f'{datetime.now().strftime("%B %d, %Y at %H:%M")}</font>',
-                    ParagraphStyle(
-                        "GenDate", parent=body_style, alignment=TA_CENTER
-                    ),
-                )
-            )
-            story.append(PageBreak())
+        # =============================================
+        #  EXECUTIVE DASHBOARD
+        # =============================================
+        story.append(Paragraph("Executive Dashboard", section_style))
+        story.append(self._section_hr())
 
-            # =============================================
-            #  EXECUTIVE DASHBOARD
-            # =============================================
-            story.append(Paragraph("Executive Dashboard", section_style))
-            story.append(
-                HRFlowable(
-                    width="100%",
-                    thickness=1,
-                    color=self.primary_color,
-                    spaceAfter=10,
-                )
-            )
+        # Key metrics cards as a table
+        score_text = (
+            f"{poc.overall_success_score}/100"
+            if poc.overall_success_score
+            else "N/A"
+        )
+        days_text = (
+            f"{m['days_remaining']}"
+            if m["days_remaining"] is not None
+            else "N/A"
+        )
 
-            # Key metrics cards as a table
-            score_text = (
-                f"{self.poc.overall_success_score}/100"
-                if self.poc.overall_success_score
-                else "N/A"
-            )
-            days_text = (
-                f"{m['days_remaining']}"
-                if m["days_remaining"] is not None
-                else "N/A"
+        cards = [
+            (f'{m["completion_pct"]}%', "Task Completion"),
+            (f'{m["completed_tasks"]}/{m["total_tasks"]}', "Tasks Done"),
+            (f'{m["criteria_met"]}/{m["criteria_total"]}', "Criteria Met"),
+            (score_text, "Success Score"),
+            (days_text, "Days Remaining"),
+            (m["total_groups"], "Task Groups"),
+            (m["total_comments"], "Comments"),
+            (m["total_participants"], "Participants"),
+        ]
+        card_cells = [
+            Paragraph(
+                _CARD_TMPL.format(
+                    color=self._primary_hex, value=value, label=label
+                ),
+                _METRIC_CARD_STYLE,
             )
+            for value, label in cards
+        ]
+        metric_data = [card_cells[:4], card_cells[4:]]
 
-            metric_data = [
-                [
-                    Paragraph(
-                        f'<font size="20" color="{self._primary_hex}">'
-                        f'<b>{m["completion_pct"]}%</b></font><br/>'
-                        f'<font size="8" color="#6B7280">Task Completion</font>',
-                        ParagraphStyle("M1", alignment=TA_CENTER),
-                    ),
-                    Paragraph(
-                        f'<font size="20" color="{self._primary_hex}">'
-                        f'<b>{m["completed_tasks"]}/{m["total_tasks"]}</b></font><br/>'
-                        f'<font size="8" color="#6B7280">Tasks Done</font>',
-                        ParagraphStyle("M2", alignment=TA_CENTER),
-                    ),
-                    Paragraph(
-                        f'<font size="20" color="{self._primary_hex}">'
-                        f'<b>{m["criteria_met"]}/{m["criteria_total"]}</b></font><br/>'
-                        f'<font size="8" color="#6B7280">Criteria Met</font>',
-                        ParagraphStyle("M3", alignment=TA_CENTER),
-                    ),
-                    Paragraph(
-                        f'<font size="20" color="{self._primary_hex}">'
-                        f"<b>{score_text}</b></font><br/>"
-                        f'<font size="8" color="#6B7280">Success Score</font>',
-                        ParagraphStyle("M4", alignment=TA_CENTER),
-                    ),
-                ],
+        metric_table = Table(metric_data, colWidths=_METRIC_COL_WIDTHS)
+        metric_table.setStyle(
+            TableStyle(
                 [
-                    Paragraph(
-                        f'<font size="20" color="{self._primary_hex}">'
-                        f"<b>{days_text}</b></font><br/>"
-                        f'<font size="8" color="#6B7280">Days Remaining</font>',
-                        ParagraphStyle("M5", alignment=TA_CENTER),
+                    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+                    (
+                        "BOX",
+                        (0, 0),
+                        (-1, -1),
+                        0.5,
+                        colors.HexColor("#E5E7EB"),
                     ),
-                    Paragraph(
-                        f'<font size="20" color="{self._primary_hex}">'
-                        f'<b>{m["total_groups"]}</b></font><br/>'
-                        f'<font size="8" color="#6B7280">Task Groups</font>',
-                        ParagraphStyle("M6", alignment=TA_CENTER),
-                    ),
-                    Paragraph(
-                        f'<font size="20" color="{self._primary_hex}">'
-                        f'<b>{m["total_comments"]}</b></font><br/>'
-                        f'<font size="8" color="#6B7280">Comments</font>',
-                        ParagraphStyle("M7", alignment=TA_CENTER),
+                    (
+                        "INNERGRID",
+                        (0, 0),
+                        (-1, -1),
+                        0.5,
+                        colors.HexColor("#E5E7EB"),
                     ),
-                    Paragraph(
-                        f'<font size="20" color="{self._primary_hex}">'
-                        f'<b>{m["total_participants"]}</b></font><br/>'
-                        f'<font size="8" color="#6B7280">Participants</font>',
-                        ParagraphStyle("M8", alignment=TA_CENTER),
+                    ("TOPPADDING", (0, 0), (-1, -1), 12),
+                    ("BOTTOMPADDING", (0, 0), (-1, -1), 12),
+                    (
+                        "BACKGROUND",
+                        (0, 0),
+                        (-1, -1),
+                        colors.HexColor("#F9FAFB"),
                     ),
-                ],
-            ]
+                ]
+            )
+        )
+        story.append(metric_table)
+        story.append(Spacer(1, 0.3 * inch))
 
-            col_w = 1.7 * inch
-            metric_table = Table(metric_data, colWidths=[col_w] * 4)
-            metric_table.setStyle(
-                TableStyle(
-                    [
-                        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                        (
-                            "BOX",
-                            (0, 0),
-                            (-1, -1),
-                            0.5,
-                            colors.HexColor("#E5E7EB"),
-                        ),
-                        (
-                            "INNERGRID",
-                            (0, 0),
-                            (-1, -1),
-                            0.5,
-                            colors.HexColor("#E5E7EB"),
-                        ),
-                        ("TOPPADDING", (0, 0), (-1, -1), 12),
-                        ("BOTTOMPADDING", (0, 0), (-1, -1), 12),
-                        (
-                            "BACKGROUND",
-                            (0, 0),
-                            (-1, -1),
-                            colors.HexColor("#F9FAFB"),
-                        ),
-                    ]
+        # --- Charts ---
+        if charts.get("progress_gauge"):
+            try:
+                img = Image(
+                    charts["progress_gauge"],
+                    width=5.5 * inch,
+                    height=2.5 * inch,
                 )
-            )
-            story.append(metric_table)
-            story.append(Spacer(1, 0.3 * inch))
+                img.hAlign = "CENTER"
+                story.append(img)
+                story.append(Spacer(1, 0.2 * inch))
+            except Exception:
+                pass
 
-            # --- Charts ---
-            if charts.get("progress_gauge"):
-                try:
-                    img = Image(
-                        charts["progress_gauge"],
-                        width=5.5 * inch,
-                        height=2.5 * inch,
-                    )
-                    img.hAlign = "CENTER"
-                    story.append(img)
-                    story.append(Spacer(1, 0.2 * inch))
-                except Exception:
-                    pass
-
-            if charts.get("task_status"):
-                try:
-                    img = Image(
-                        charts["task_status"],
-                        width=4.5 * inch,
-                        height=3.2 * inch,
-                    )
-                    img.hAlign = "CENTER"
-                    story.append(img)
-                    story.append(Spacer(1, 0.2 * inch))
-                except Exception:
-                    pass
-
-            if charts.get("success_criteria"):
-                try:
-                    n_criteria = len(m["criteria_data"])
-                    chart_h = max(2.5, n_criteria * 0.6 + 1)
-                    img = Image(
-                        charts["success_criteria"],
-                        width=6 * inch,
-                        height=chart_h * inch,
-                    )
-                    img.hAlign = "CENTER"
-                    story.append(img)
-                    story.append(Spacer(1, 0.2 * inch))
-                except Exception:
-                    pass
+        if charts.get("task_status"):
+            try:
+                img = Image(
+                    charts["task_status"],
+                    width=4.5 * inch,
+                    height=3.2 * inch,
+                )
+                img.hAlign = "CENTER"
+                story.append(img)
+                story.append(Spacer(1, 0.2 * inch))
+            except Exception:
+                pass
 
-            story.append(PageBreak())
+        if charts.get("success_criteria"):
+            try:
+                n_criteria = len(m["criteria_data"])
+                chart_h = max(2.5, n_criteria * 0.6 + 1)
+                img = Image(
+                    charts["success_criteria"],
+                    width=6 * inch,
+                    height=chart_h * inch,
+                )
+                img.hAlign = "CENTER"
+                story.append(img)
+                story.append(Spacer(1, 0.2 * inch))
+            except Exception:
+                pass
 
-            # Timeline chart
-            if charts.get("timeline"):
-                story.append(Paragraph("POC Timeline", section_style))
-                story.append(
-                    HRFlowable(
-                        width="100%",
-                        thickness=1,
-                        color=self.primary_color,
-                        spaceAfter=10,
-                    )
+        story.append(PageBreak())
+
+        # Timeline chart
+        if charts.get("timeline"):
+            story.append(Paragraph("POC Timeline", section_style))
+            story.append(self._section_hr())
+            try:
+                n_items = len(m["timeline_items"])
+                chart_h = max(2.5, n_items * 0.4 + 1.5)
+                img = Image(
+                    charts["timeline"],
+                    width=6.5 * inch,
+                    height=chart_h * inch,
                 )
-                try:
-                    n_items = len(m["timeline_items"])
-                    chart_h = max(2.5, n_items * 0.4 + 1.5)
-                    img = Image(
-                        charts["timeline"],
-                        width=6.5 * inch,
-                        height=chart_h * inch,
-                    )
-                    img.hAlign = "CENTER"
-                    story.append(img)
-                    story.append(Spacer(1, 0.3 * inch))
-                except Exception:
-                    pass
-
-            # Workload chart
-            if charts.get("workload"):
-                story.append(Paragraph("Team Workload", section_style))
-                story.append(
-                    HRFlowable(
-                        width="100%",
-                        thickness=1,
-                        color=self.primary_color,
-                        spaceAfter=10,
-                    )
+                img.hAlign = "CENTER"
+                story.append(img)
+                story.append(Spacer(1, 0.3 * inch))
+            except Exception:
+                pass
+
+        # Workload chart
+        if charts.get("workload"):
+            story.append(Paragraph("Team Workload", section_style))
+            story.append(self._section_hr())
+            try:
+                n_assignees = len(m["assignee_workload"])
+                chart_h = max(2.5, n_assignees * 0.5 + 1)
+                img = Image(
+                    charts["workload"],
+                    width=6 * inch,
+                    height=chart_h * inch,
                 )
-                try:
-                    n_assignees = len(m["assignee_workload"])
-                    chart_h = max(2.5, n_assignees * 0.5 + 1)
-                    img = Image(
-                        charts["workload"],
-                        width=6 * inch,
-                        height=chart_h * inch,
-                    )
-                    img.hAlign = "CENTER"
-                    story.append(img)
-                    story.append(Spacer(1, 0.3 * inch))
-                except Exception:
-                    pass
-
-            # Activity chart
-            if charts.get("activity"):
-                story.append(Paragraph("Activity Over Time", section_style))
-                story.append(
-                    HRFlowable(
-                        width="100%",
-                        thickness=1,
-                        color=self.primary_color,
-                        spaceAfter=10,
-                    )
+                img.hAlign = "CENTER"
+                story.append(img)
+                story.append(Spacer(1, 0.3 * inch))
+            except Exception:
+                pass
+
+        # Activity chart
+        if charts.get("activity"):
+            story.append(Paragraph("Activity Over Time", section_style))
+            story.append(self._section_hr())
+            try:
+                img = Image(
+                    charts["activity"],
+                    width=6 * inch,
+                    height=2.8 * inch,
                 )
-                try:
-                    img = Image(
-                        charts["activity"],
-                        width=6 * inch,
-                        height=2.8 * inch,
-                    )
-                    img.hAlign = "CENTER"
-                    story.append(img)
-                    story.append(Spacer(1, 0.3 * inch))
-                except Exception:
-                    pass
+                img.hAlign = "CENTER"
+                story.append(img)
+                story.append(Spacer(1, 0.3 * inch))
+            except Exception:
+                pass
 
-            story.append(PageBreak())
+        story.append(PageBreak())
+
+        # =============================================
+        #  DESCRIPTION / EXECUTIVE SUMMARY / OBJECTIVES
+        # =============================================
+        if poc.description or poc.executive_summary or poc.objectives:
+            story.append(Paragraph("POC Overview", section_style))
+            story.append(self._section_hr())
 
-            # =============================================
-            #  DESCRIPTION / EXECUTIVE SUMMARY / OBJECTIVES
-            # =============================================
-            if (
-                self.poc.description
-                or self.poc.executive_summary
-                or self.poc.objectives
-            ):
-                story.append(Paragraph("POC Overview", section_style))
+            if poc.executive_summary:
+                story.append(Paragraph("Executive Summary", subsection_style))
                 story.append(
-                    HRFlowable(
-                        width="100%",
-                        thickness=1,
-                        color=self.primary_color,
-                        spaceAfter=10,
-                    )
+                    Paragraph(_xml_escape(poc.executive_summary), body_style)
                 )
+                story.append(Spacer(1, 0.15 * inch))
 
-                if self.poc.executive_summary:
-                    story.append(
-                        Paragraph("Executive Summary", subsection_style)
-                    )
-                    story.append(
-                        Paragraph(self.poc.executive_summary, body_style)
-                    )
-                    story.append(Spacer(1, 0.15 * inch))
-
-                if self.poc.description:
-                    story.append(Paragraph("Description", subsection_style))
-                    story.append(Paragraph(self.poc.description, body_style))
-                    story.append(Spacer(1, 0.15 * inch))
-
-                if self.poc.objectives:
-                    story.append(Paragraph("Objectives", subsection_style))
-                    story.append(Paragraph(self.poc.objectives, body_style))
-                    story.append(Spacer(1, 0.15 * inch))
-
-            # Products
-            if self.poc.products:
-                story.append(Paragraph("Products", subsection_style))
-                for product in self.poc.products:
-                    story.append(
-                        Paragraph(f"&bull; {product.name}", body_style)
-                    )
+            if poc.description:
+                story.append(Paragraph("Description", subsection_style))
+                story.append(
+                    Paragraph(_xml_escape(poc.description), body_style)
+                )
                 story.append(Spacer(1, 0.15 * inch))
 
-            # =============================================
-            #  SUCCESS CRITERIA TABLE
-            # =============================================
-            criteria = self.poc.success_criteria
-            if criteria:
-                story.append(Paragraph("Success Criteria", section_style))
+            if poc.objectives:
+                story.append(Paragraph("Objectives", subsection_style))
                 story.append(
-                    HRFlowable(
-                        width="100%",
-                        thickness=1,
-                        color=self.primary_color,
-                        spaceAfter=10,
-                    )
+                    Paragraph(_xml_escape(poc.objectives), body_style)
+                )
+                story.append(Spacer(1, 0.15 * inch))
+
+        # Products
+        if poc.products:
+            story.append(Paragraph("Products", subsection_style))
+            # One Paragraph for the whole list: the markup parser runs once
+            # instead of once per product.
+            story.append(
+                Paragraph(
+                    "<br/>".join(
+                        f"&bull; {_xml_escape(product.name)}"
+                        for product in poc.products
+                    ),
+                    body_style,
                 )
+            )
+            story.append(Spacer(1, 0.15 * inch))
 
-                criteria_header = [
+        # =============================================
+        #  SUCCESS CRITERIA TABLE
+        # =============================================
+        criteria = poc.success_criteria
+        if criteria:
+            story.append(Paragraph("Success Criteria", section_style))
+            story.append(self._section_hr())
+
+            criteria_header = [
+                [
+                    "#",
+                    "Criteria",
+                    "Target",
+                    "Achieved",
+                    "Importance",
+                    "Met",
+                ]
+            ]
+            criteria_rows = []
+            for i, c in enumerate(criteria, 1):
+                stars = "*" * (c.importance_level or 3)
+                met_icon = "Yes" if c.is_met else "No"
+                criteria_rows.append(
                     [
-                        "#",
-                        "Criteria",
-                        "Target",
-                        "Achieved",
-                        "Importance",
-                        "Met",
+                        str(i),
+                        c.title,
+                        c.target_value or "N/A",
+                        c.achieved_value or "N/A",
+                        stars,
+                        met_icon,
                     ]
-                ]
-                criteria_rows = []
-                for i, c in enumerate(criteria, 1):
-                    stars = "*" * (c.importance_level or 3)
-                    met_icon = "Yes" if c.is_met else "No"
-                    criteria_rows.append(
-                        [
-                            str(i),
-                            c.title,
-                            c.target_value or "N/A",
-                            c.achieved_value or "N/A",
-                            stars,
-                            met_icon,
-                        ]
-                    )
-
-                criteria_table = Table(
-                    criteria_header + criteria_rows,
-                    colWidths=[
-                        0.4 * inch,
-                        2.2 * inch,
-                        1.2 * inch,
-                        1.2 * inch,
-                        0.9 * inch,
-                        0.5 * inch,
-                    ],
                 )
-                criteria_table.setStyle(
-                    TableStyle(
-                        [
-                            (
-                                "BACKGROUND",
-                                (0, 0),
-                                (-1, 0),
-                                self.primary_color,
-                            ),
-                            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                            (
-                                "FONTNAME",
-                                (0, 0),
-                                (-1, 0),
-                                "Helvetica-Bold",
-                            ),
-                            ("FONTSIZE", (0, 0), (-1, -1), 9),
-                            ("ALIGN", (0, 0), (0, -1), "CENTER"),
-                            ("ALIGN", (4, 0), (5, -1), "CENTER"),
-                            ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
-                            ("TOPPADDING", (0, 0), (-1, -1), 6),
-                            (
-                                "GRID",
-                                (0, 0),
-                                (-1, -1),
-                                0.5,
-                                colors.HexColor("#E5E7EB"),
-                            ),
-                            (
-                                "ROWBACKGROUNDS",
-                                (0, 1),
-                                (-1, -1),
-                                [colors.white, colors.HexColor("#F9FAFB")],
-                            ),
-                        ]
-                    )
-                )
-                story.append(criteria_table)
-                story.append(Spacer(1, 0.3 * inch))
 
-            # =============================================
-            #  INDIVIDUAL TASKS
-            # =============================================
-            tasks = self._get_all_tasks()
-            if tasks:
-                story.append(Paragraph("Tasks", section_style))
-                story.append(
-                    HRFlowable(
-                        width="100%",
-                        thickness=1,
-                        color=self.primary_color,
-                        spaceAfter=10,
-                    )
-                )
+            criteria_table = LongTable(
+                criteria_header + criteria_rows,
+                colWidths=_CRITERIA_COL_WIDTHS,
+                repeatRows=1,
+                splitByRow=1,
+            )
+            criteria_table.setStyle(self._criteria_table_style)
+            story.append(criteria_table)
+            story.append(Spacer(1, 0.3 * inch))
 
-                for task in tasks:
-                    story.extend(
-                        self._pdf_render_task(
-                            task,
-                            styles,
-                            body_style,
-                            body_indent,
-                            subsection_style,
-                        )
-                    )
+        # =============================================
+        #  INDIVIDUAL TASKS
+        # =============================================
+        tasks = self._get_all_tasks()
+        if tasks:
+            story.append(Paragraph("Tasks", section_style))
+            story.append(self._section_hr())
 
-            # =============================================
-            #  TASK GROUPS
-            # =============================================
-            groups = self._get_all_task_groups()
-            if groups:
-                story.append(PageBreak())
-                story.append(Paragraph("Task Groups", section_style))
-                story.append(
-                    HRFlowable(
-                        width="100%",
-                        thickness=1,
-                        color=self.primary_color,
-                        spaceAfter=10,
+            for task in tasks:
+                story.extend(
+                    self._pdf_render_task(
+                        task,
+                        styles,
+                        body_style,
+                        body_indent,
+                        subsection_style,
                     )
                 )
 
-                for group in groups:
-                    status_val = (
-                        group.status.value if group.status else "not_started"
-                    )
-                    status_label = status_val.replace("_", " ").title()
-                    group_title = f"{group.title}  &mdash;  {status_label}"
-
-                    group_heading_style = ParagraphStyle(
-                        "GrpTitle",
-                        parent=styles["Heading3"],
-                        textColor=self.primary_color,
-                        fontSize=13,
-                        spaceBefore=14,
-                    )
-                    story.append(Paragraph(group_title, group_heading_style))
+        # =============================================
+        #  TASK GROUPS
+        # =============================================
+        groups = self._get_all_task_groups()
+        if groups:
+            story.append(PageBreak())
+            story.append(Paragraph("Task Groups", section_style))
+            story.append(self._section_hr())
+
+            group_heading_style = tenant_styles["GrpTitle"]
+            for group in groups:
+                status_val = (
+                    group.status.value if group.status else "not_started"
+                )
+                status_label = _STATUS_LABELS[status_val]
+                group_title = (
+                    f"{_xml_escape(group.title)}  &mdash;  {status_label}"
+                )
 
-                    if group.description:
-                        story.append(Paragraph(group.description, body_style))
-                        story.append(Spacer(1, 0.1 * inch))
+                story.append(Paragraph(group_title, group_heading_style))
 
-                    # Group resources
-                    group_resources = (
-                        self.db.query(Resource)
-                        .filter(Resource.poc_task_group_id == group.id)
-                        .all()
+                if group.description:
+                    story.append(
+                        Paragraph(_xml_escape(group.description), body_style)
                     )
-                    if group_resources:
-                        story.append(
-                            Paragraph("<b>Group Resources:</b>", body_style)
-                        )
-                        for res in group_resources:
-                            res_text = (
-                                f"&bull; <b>{res.title}</b>"
-                                f" ({res.resource_type.value})"
-                            )
-                            if res.description:
-                                res_text += f" &mdash; {res.description}"
-                            if (
-                                res.resource_type.value == "LINK"
-                                and res.content
-                            ):
-                                res_text += (
-                                    f'<br/>  <a href="{res.content}"'
-                                    f' color="blue">{res.content}</a>'
-                                )
-                            story.append(Paragraph(res_text, body_indent))
-                        story.append(Spacer(1, 0.1 * inch))
-
-                    # Group comments
-                    group_comments = (
-                        self.db.query(Comment)
-                        .filter(Comment.poc_task_group_id == group.id)
-                        .order_by(Comment.created_at.desc())
-                        .limit(5)
-                        .all()
+                    story.append(Spacer(1, 0.1 * inch))
+
+                # Group resources
+                group_resources = self._get_group_resources(group)
+                if group_resources:
+                    story.append(
+                        Paragraph("<b>Group Resources:</b>", body_style)
                     )
-                    if group_comments:
-                        story.append(
-                            Paragraph("<b>Group Comments:</b>", body_style)
+                    for res in group_resources:
+                        rtype = res.resource_type.value
+                        res_text = (
+                            f"&bull; <b>{_xml_escape(res.title)}</b> ({rtype})"
                         )
-                        for c in reversed(group_comments):
-                            author = self._comment_author_name(c)
-                            dt = c.created_at.strftime("%Y-%m-%d %H:%M")
-                            vis = "Internal" if c.is_internal else "Public"
-                            story.append(
-                                Paragraph(
-                                    f"&bull; <b>{author}</b> ({vis})"
-                                    f" &mdash; {dt}<br/>  {c.content}",
-                                    body_indent,
-                                )
+                        if res.description:
+                            res_text += (
+                                f" &mdash; {_xml_escape(res.description)}"
                             )
-                        story.append(Spacer(1, 0.1 * inch))
-
-                    # Tasks in group
-                    group_tasks = self._get_group_tasks(group)
-                    if group_tasks:
-                        for task in group_tasks:
-                            story.extend(
-                                self._pdf_render_task(
-                                    task,
-                                    styles,
-                                    body_indent,
-                                    body_indent,
-                                    subsection_style,
-                                    indent=True,
-                                )
+                        if rtype == "LINK" and res.content:
+                            res_text += (
+                                f'<br/>  <a href="{_xml_escape(res.content, _ATTR_ENTITIES)}"'
+                                f' color="blue">{_xml_escape(res.content)}</a>'
                             )
+                        story.append(Paragraph(res_text, body_indent))
+                    story.append(Spacer(1, 0.1 * inch))
 
-                    story.append(Spacer(1, 0.15 * inch))
-
-            # =============================================
-            #  POC-LEVEL RESOURCES
-            # =============================================
-            poc_resources = self._get_poc_resources()
-            if poc_resources:
-                story.append(Paragraph("POC Resources", section_style))
-                story.append(
-                    HRFlowable(
-                        width="100%",
-                        thickness=1,
-                        color=self.primary_color,
-                        spaceAfter=10,
-                    )
-                )
-                for resource in poc_resources:
+                # Group comments
+                group_comments = self._get_group_comments(group)
+                if group_comments:
                     story.append(
-                        Paragraph(
-                            f"<b>{resource.title}</b>"
-                            f" ({resource.resource_type.value})",
-                            subsection_style,
-                        )
+                        Paragraph("<b>Group Comments:</b>", body_style)
                     )
-                    if resource.description:
-                        story.append(
-                            Paragraph(resource.description, body_style)
-                        )
-                    if (
-                        resource.resource_type.value == "LINK"
-                        and resource.content
-                    ):
+                    for c in group_comments:
+                        author = self._comment_author_name(c)
+                        dt = _fmt_dt(c.created_at)
+                        vis = "Internal" if c.is_internal else "Public"
                         story.append(
                             Paragraph(
-                                f'<a href="{resource.content}"'
-                                f' color="blue">{resource.content}</a>',
-                                body_style,
+                                f"&bull; <b>{_xml_escape(author)}</b> ({vis})"
+                                f" &mdash; {dt}<br/>  {_xml_escape(c.content)}",
+                                body_indent,
                             )
                         )
-                    elif resource.content:
-                        story.append(Paragraph(resource.content, body_style))
                     story.append(Spacer(1, 0.1 * inch))
 
-            # =============================================
-            #  PARTICIPANTS
-            # =============================================
-            participants = self._get_participants()
-            if participants:
-                story.append(Paragraph("Participants", section_style))
+                # Tasks in group
+                group_tasks = self._get_group_tasks(group)
+                if group_tasks:
+                    for task in group_tasks:
+                        story.extend(
+                            self._pdf_render_task(
+                                task,
+                                styles,
+                                body_indent,
+                                body_indent,
+                                subsection_style,
+                                indent=True,
+                            )
+                        )
+
+                story.append(Spacer(1, 0.15 * inch))
+
+        # =============================================
+        #  POC-LEVEL RESOURCES
+        # =============================================
+        poc_resources = self._get_poc_resources()
+        if poc_resources:
+            story.append(Paragraph("POC Resources", section_style))
+            story.append(self._section_hr())
+            for resource in poc_resources:
+                rtype = resource.resource_type.value
                 story.append(
-                    HRFlowable(
-                        width="100%",
-                        thickness=1,
-                        color=self.primary_color,
-                        spaceAfter=10,
+                    Paragraph(
+                        f"<b>{_xml_escape(resource.title)}</b> ({rtype})",
+                        subsection_style,
                     )
                 )
-
-                p_header = [["Name", "Email", "Role", "Joined"]]
-                p_rows = []
-                for p in participants:
-                    if p.user:
-                        name = p.user.full_name or p.user.email
-                        email = p.user.email
-                        role_parts = []
-                        if p.is_sales_engineer:
-                            role_parts.append("Sales Engineer")
-                        if p.is_customer:
-                            role_parts.append("Customer")
-                        role = (
-                            ", ".join(role_parts)
-                            if role_parts
-                            else "Participant"
-                        )
-                        joined = (
-                            p.joined_at.strftime("%Y-%m-%d")
-                            if p.joined_at
-                            else "N/A"
-                        )
-                        p_rows.append([name, email, role, joined])
-
-                if p_rows:
-                    p_table = Table(
-                        p_header + p_rows,
-                        colWidths=[
-                            1.8 * inch,
-                            2.2 * inch,
-                            1.3 * inch,
-                            1 * inch,
-                        ],
-                    )
-                    p_table.setStyle(
-                        TableStyle(
-                            [
-                                (
-                                    "BACKGROUND",
-                                    (0, 0),
-                                    (-1, 0),
-                                    self.primary_color,
-                                ),
-                                (
-                                    "TEXTCOLOR",
-                                    (0, 0),
-                                    (-1, 0),
-                                    colors.white,
-                                ),
-                                (
-                                    "FONTNAME",
-                                    (0, 0),
-                                    (-1, 0),
-                                    "Helvetica-Bold",
-                                ),
-                                ("FONTSIZE", (0, 0), (-1, -1), 9),
-                                ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
-                                (
-                                    "GRID",
-                                    (0, 0),
-                                    (-1, -1),
-                                    0.5,
-                                    colors.HexColor("#E5E7EB"),
-                                ),
-                                (
-                                    "ROWBACKGROUNDS",
-                                    (0, 1),
-                                    (-1, -1),
-                                    [
-                                        colors.white,
-                                        colors.HexColor("#F9FAFB"),
-                                    ],
-                                ),
-                            ]
+                if resource.description:
+                    story.append(
+                        Paragraph(
+                            _xml_escape(resource.description), body_style
                         )
                     )
-                    story.append(p_table)
-
-            # =============================================
-            #  POC-LEVEL COMMENTS
-            # =============================================
-            poc_comments = (
-                self.db.query(Comment)
-                .filter(
-                    Comment.poc_id == self.poc.id,
-                    Comment.poc_task_id.is_(None),
-                    Comment.poc_task_group_id.is_(None),
-                )
-                .order_by(Comment.created_at.desc())
-                .limit(10)
-                .all()
-            )
-            if poc_comments:
-                story.append(Paragraph("Recent POC Comments", section_style))
-                story.append(
-                    HRFlowable(
-                        width="100%",
-                        thickness=1,
-                        color=self.primary_color,
-                        spaceAfter=10,
-                    )
-                )
-                for c in reversed(poc_comments):
-                    author = self._comment_author_name(c)
-                    dt = c.created_at.strftime("%Y-%m-%d %H:%M")
-                    vis = "Internal" if c.is_internal else "Public"
+                if rtype == "LINK" and resource.content:
                     story.append(
                         Paragraph(
-                            f"&bull; <b>{author}</b> ({vis})"
-                            f" &mdash; {dt}<br/>  {c.content}",
+                            f'<a href="{_xml_escape(resource.content, _ATTR_ENTITIES)}"'
+                            f' color="blue">{_xml_escape(resource.content)}</a>',
                             body_style,
                         )
                     )
+                elif resource.content:
+                    story.append(
+                        Paragraph(_xml_escape(resource.content), body_style)
+                    )
                 story.append(Spacer(1, 0.1 * inch))
 
-            # Build PDF
-            doc.build(story)
+        # =============================================
+        #  PARTICIPANTS
+        # =============================================
+        participants = self._get_participants()
+        if participants:
+            story.append(Paragraph("Participants", section_style))
+            story.append(self._section_hr())
+
+            p_header = [["Name", "Email", "Role", "Joined"]]
+            p_rows = self._participant_rows()
+
+            if p_rows:
+                p_table = LongTable(
+                    p_header + p_rows,
+                    colWidths=_PARTICIPANT_COL_WIDTHS,
+                    repeatRows=1,
+                    splitByRow=1,
+                )
+                p_table.setStyle(self._participants_table_style)
+                story.append(p_table)
+
+        # =============================================
+        #  POC-LEVEL COMMENTS
+        # =============================================
+        poc_comments = self._get_poc_comments()
+        if poc_comments:
+            story.append(Paragraph("Recent POC Comments", section_style))
+            story.append(self._section_hr())
+            for c in poc_comments:
+                author = self._comment_author_name(c)
+                dt = _fmt_dt(c.created_at)
+                vis = "Internal" if c.is_internal else "Public"
+                story.append(
+                    Paragraph(
+                        f"&bull; <b>{_xml_escape(author)}</b> ({vis})"
+                        f" &mdash; {dt}<br/>  {_xml_escape(c.content)}",
+                        body_style,
+                    )
+                )
+            story.append(Spacer(1, 0.1 * inch))
 
-        finally:
-            cleanup_chart_files(self._chart_files)
+        # Build PDF
+        doc.build(story)
 
-        return output_path
+        return buf.getvalue()
 
     def _pdf_render_task(
         self,
@@ -1274,54 +1497,34 @@ class DocumentGenerator:
         subsection_style,
         indent=False,
     ):
-        """Render a single task to a list of PDF flowable elements."""
-        elements = []
-        status_emoji = {
-            "not_started": "[ ]",
-            "in_progress": "[~]",
-            "completed": "[x]",
-            "blocked": "[!]",
-        }
-        marker = status_emoji.get(task.status.value, "[ ]")
-        status_label = task.status.value.replace("_", " ").title()
-        task_title = f"{marker} {task.title}  &mdash;  {status_label}"
-
-        left = 20 if indent else 0
-        task_style = ParagraphStyle(
-            "TaskTitleStyle",
-            parent=subsection_style,
-            leftIndent=left,
+        """Yield the PDF flowables for a single task."""
+        marker = _MARKER.get(task.status, "[ ]")
+        status_label = _STATUS_LABELS[task.status.value]
+        task_title = (
+            f"{marker} {_xml_escape(task.title)}  &mdash;  {status_label}"
         )
-        elements.append(Paragraph(task_title, task_style))
 
-        tb = ParagraphStyle("TaskBody", parent=body_style, leftIndent=left)
+        task_style = _tenant_styles(self._primary_hex, self._secondary_hex)[
+            "TaskTitleIndent" if indent else "TaskTitle"
+        ]
+        yield Paragraph(task_title, task_style)
+
+        # Callers pass BodyText, or BodyIndent for indented tasks, so the
+        # body style already carries the right indent.
+        tb = body_style
 
         if task.description:
-            elements.append(Paragraph(task.description, tb))
+            yield Paragraph(_xml_escape(task.description), tb)
 
         # Dates
-        date_parts = []
-        if task.start_date:
-            date_parts.append(f"Start: {task.start_date}")
-        if task.due_date:
-            date_parts.append(f"Due: {task.due_date}")
-        if task.completed_at:
-            date_parts.append(f"Completed: {task.completed_at}")
-        if date_parts:
-            elements.append(
-                Paragraph(
-                    f'<font color="#6B7280">'
-                    f'{" | ".join(date_parts)}</font>',
-                    tb,
-                )
-            )
+        start, due, done = task.start_date, task.due_date, task.completed_at
+        mask = bool(start) << 2 | bool(due) << 1 | bool(done)
+        if mask:
+            dates = _PDF_TASK_DATES[mask].format(start, due, done)
+            yield Paragraph(f'<font color="#6B7280">{dates}</font>', tb)
 
         # Assignees
-        assignees = (
-            self.db.query(POCTaskAssignee)
-            .filter(POCTaskAssignee.poc_task_id == task.id)
-            .all()
-        )
+        assignees = task.assignees
         if assignees:
             names = []
             for a in assignees:
@@ -1330,132 +1533,132 @@ class DocumentGenerator:
                         a.participant.user.full_name
                         or a.participant.user.email
                     )
-                    names.append(name)
+                    names.append(_xml_escape(name))
             if names:
-                elements.append(
-                    Paragraph(f"<b>Assigned to:</b> {', '.join(names)}", tb)
-                )
+                yield Paragraph(f"<b>Assigned to:</b> {', '.join(names)}", tb)
 
         # Resources
-        task_resources = (
-            self.db.query(Resource)
-            .filter(Resource.poc_task_id == task.id)
-            .all()
-        )
+        task_resources = task.resources
         if task_resources:
-            elements.append(Paragraph("<b>Resources:</b>", tb))
+            yield Paragraph("<b>Resources:</b>", tb)
             for res in task_resources:
-                res_text = (
-                    f"&bull; <b>{res.title}</b>"
-                    f" ({res.resource_type.value})"
-                )
+                rtype = res.resource_type.value
+                res_text = f"&bull; <b>{_xml_escape(res.title)}</b> ({rtype})"
                 if res.description:
-                    res_text += f" &mdash; {res.description}"
-                if res.resource_type.value == "LINK" and res.content:
+                    res_text += f" &mdash; {_xml_escape(res.description)}"
+                if rtype == "LINK" and res.content:
                     res_text += (
-                        f'<br/>  <a href="{res.content}"'
-                        f' color="blue">{res.content}</a>'
+                        f'<br/>  <a href="{_xml_escape(res.content, _ATTR_ENTITIES)}"'
+                        f' color="blue">{_xml_escape(res.content)}</a>'
                     )
-                elements.append(Paragraph(res_text, tb))
+                yield Paragraph(res_text, tb)
 
         # Success criteria linked to this task
-        if hasattr(task, "task_criteria") and task.task_criteria:
-            elements.append(Paragraph("<b>Success Criteria:</b>", tb))
-            for tc in task.task_criteria:
-                sc = (
-                    tc.success_criteria
-                    if hasattr(tc, "success_criteria")
-                    else None
-                )
+        task_criteria = task.task_criteria
+        if task_criteria:
+            yield Paragraph("<b>Success Criteria:</b>", tb)
+            for tc in task_criteria:
+                sc = tc.success_criteria
                 if sc:
                     met = "Yes" if sc.is_met else "No"
-                    elements.append(
-                        Paragraph(f"&bull; [{met}] {sc.title}", tb)
+                    yield Paragraph(
+                        f"&bull; [{met}] {_xml_escape(sc.title)}", tb
                     )
 
         # Comments
-        comments = (
-            self.db.query(Comment)
-            .filter(Comment.poc_task_id == task.id)
-            .order_by(Comment.created_at.desc())
-            .limit(5)
-            .all()
-        )
+        comments = self._get_task_comments(task)
         if comments:
-            elements.append(Paragraph("<b>Latest Comments:</b>", tb))
-            for c in reversed(comments):
+            yield Paragraph("<b>Latest Comments:</b>", tb)
+            for c in comments:
                 author = self._comment_author_name(c)
-                dt = c.created_at.strftime("%Y-%m-%d %H:%M")
+                dt = _fmt_dt(c.created_at)
                 vis = "Internal" if c.is_internal else "Public"
-                elements.append(
-                    Paragraph(
-                        f"&bull; <b>{author}</b> ({vis})"
-                        f" &mdash; {dt}<br/>  {c.content}",
-                        tb,
-                    )
+                yield Paragraph(
+                    f"&bull; <b>{_xml_escape(author)}</b> ({vis})"
+                    f" &mdash; {dt}<br/>  {_xml_escape(c.content)}",
+                    tb,
                 )
 
-        elements.append(Spacer(1, 0.15 * inch))
-        return elements
+        yield Spacer(1, 0.15 * inch)
 
     # ------------------------------------------------------------------ #
     #  Markdown Generation                                                 #
     # ------------------------------------------------------------------ #
 
-    def generate_markdown(self, output_path: str):
-        """Generate a comprehensive Markdown report with embedded charts."""
+    def generate_markdown(self, output_path: str, embed_images: bool = False):
+        """Generate a comprehensive Markdown report with charts.
+
+        Charts are referenced by their cached PNG paths unless
+        ``embed_images`` is set, in which case they are inlined as data URIs
+        so the report is a self-contained file.
+        """
+        # Sections are written as they are built, so memory stays flat no
+        # matter how large the report grows.
+        try:
+            with open(output_path, "w", encoding="utf-8") as out:
+                self._write_markdown(out, embed_images)
+        except BaseException:
+            Path(output_path).unlink(missing_ok=True)
+            raise
+
+        return output_path
+
+    def _write_markdown(self, buf: TextIO, embed_images: bool) -> None:
+        """Write the Markdown report body to ``buf``."""
+        poc = self.poc
         m = self._compute_metrics()
-        charts = self._generate_charts(as_base64=True)
+        charts = _CHART_POOL.submit(
+            self._generate_charts, embed_images, not embed_images
+        ).result()
 
-        md: List[str] = []
+        def emit(line: str) -> None:
+            buf.write(line)
+            buf.write("\n")
 
         # =============================================
         #  HEADER / COVER
         # =============================================
-        if self.poc.customer_logo_url:
-            md.append('<div align="center">')
-            md.append(
-                f'<img src="{self.poc.customer_logo_url}"'
+        if poc.customer_logo_url:
+            emit('<div align="center">')
+            emit(
+                f'<img src="{poc.customer_logo_url}"'
                 f' alt="Customer Logo" width="200"/>'
             )
-            md.append("</div>\n")
+            emit("</div>")
+            emit("")
 
-        md.append('<div align="center">')
-        md.append(
+        emit('<div align="center">')
+        emit(
             f'<h2 style="color: {self._secondary_hex};">'
-            f"{self.poc.customer_company_name}</h2>"
+            f"{poc.customer_company_name}</h2>"
         )
-        md.append("</div>\n")
+        emit("</div>")
+        emit("")
 
-        md.append(
-            f'<h1 style="color: {self._primary_hex};">'
-            f"{self.poc.title}</h1>\n"
-        )
+        emit(f'<h1 style="color: {self._primary_hex};">' f"{poc.title}</h1>")
+        emit("")
 
-        status_text = self.poc.status.value.replace("_", " ").title()
-        start_str = str(self.poc.start_date) if self.poc.start_date else "TBD"
-        end_str = str(self.poc.end_date) if self.poc.end_date else "TBD"
-        md.append(
+        status_text = _STATUS_LABELS[poc.status.value]
+        start_str, end_str = self._start_str, self._end_str
+        emit(
             f"**Status:** {status_text} &nbsp;|&nbsp;"
-            f" **Period:** {start_str} — {end_str}\n"
-        )
-        md.append(
-            f"<sub>Generated on"
-            f' {datetime.now().strftime("%B %d, %Y at %H:%M")}</sub>\n'
+            f" **Period:** {start_str} — {end_str}"
         )
-        md.append("---\n")
+        emit("")
+        emit(f"<sub>Generated on {self._generated_str}</sub>")
+        emit("")
+        emit("---")
+        emit("")
 
         # =============================================
         #  EXECUTIVE DASHBOARD
         # =============================================
-        md.append(
-            f'<h2 style="color: {self._primary_hex};">'
-            f"Executive Dashboard</h2>\n"
-        )
+        emit(f"{self._h2_open}Executive Dashboard</h2>")
+        emit("")
 
         score_text = (
-            f"{self.poc.overall_success_score}/100"
-            if self.poc.overall_success_score
+            f"{poc.overall_success_score}/100"
+            if poc.overall_success_score
             else "N/A"
         )
         days_text = (
@@ -1464,413 +1667,340 @@ class DocumentGenerator:
             else "N/A"
         )
 
-        md.append("| Metric | Value |")
-        md.append("|--------|-------|")
-        md.append(
+        emit("| Metric | Value |")
+        emit("|--------|-------|")
+        emit(
             f"| **Task Completion** |"
             f" {m['completion_pct']}%"
             f" ({m['completed_tasks']}/{m['total_tasks']}) |"
         )
-        md.append(
+        emit(
             f"| **Success Criteria Met** |"
             f" {m['criteria_met']}/{m['criteria_total']}"
             f" ({m['criteria_pct']}%) |"
         )
-        md.append(f"| **Success Score** | {score_text} |")
-        md.append(f"| **Days Remaining** | {days_text} |")
-        md.append(f"| **Task Groups** | {m['total_groups']} |")
-        md.append(
+        emit(f"| **Success Score** | {score_text} |")
+        emit(f"| **Days Remaining** | {days_text} |")
+        emit(f"| **Task Groups** | {m['total_groups']} |")
+        emit(
             f"| **Total Comments** |"
             f" {m['total_comments']}"
             f" (Internal: {m['internal_comments']}) |"
         )
-        md.append(f"| **Participants** | {m['total_participants']} |")
-        md.append("")
+        emit(f"| **Participants** | {m['total_participants']} |")
+        emit("")
 
         # Charts
         if charts.get("progress_gauge"):
-            md.append("### Overall Progress\n")
-            md.append(
+            emit("### Overall Progress")
+            emit("")
+            emit(
                 f'<div align="center">'
                 f'<img src="{charts["progress_gauge"]}"'
-                f' alt="Progress Gauge" width="600"/></div>\n'
+                f' alt="Progress Gauge" width="600"/></div>'
             )
+            emit("")
 
         if charts.get("task_status"):
-            md.append("### Task Status Distribution\n")
-            md.append(
+            emit("### Task Status Distribution")
+            emit("")
+            emit(
                 f'<div align="center">'
                 f'<img src="{charts["task_status"]}"'
-                f' alt="Task Status" width="500"/></div>\n'
+                f' alt="Task Status" width="500"/></div>'
             )
+            emit("")
 
         if charts.get("success_criteria"):
-            md.append("### Success Criteria Achievement\n")
-            md.append(
+            emit("### Success Criteria Achievement")
+            emit("")
+            emit(
                 f'<div align="center">'
                 f'<img src="{charts["success_criteria"]}"'
-                f' alt="Success Criteria" width="600"/></div>\n'
+                f' alt="Success Criteria" width="600"/></div>'
             )
+            emit("")
 
         if charts.get("timeline"):
-            md.append("### POC Timeline\n")
-            md.append(
+            emit("### POC Timeline")
+            emit("")
+            emit(
                 f'<div align="center">'
                 f'<img src="{charts["timeline"]}"'
-                f' alt="Timeline" width="700"/></div>\n'
+                f' alt="Timeline" width="700"/></div>'
             )
+            emit("")
 
         if charts.get("workload"):
-            md.append("### Team Workload\n")
-            md.append(
+            emit("### Team Workload")
+            emit("")
+            emit(
                 f'<div align="center">'
                 f'<img src="{charts["workload"]}"'
-                f' alt="Workload" width="600"/></div>\n'
+                f' alt="Workload" width="600"/></div>'
             )
+            emit("")
 
         if charts.get("activity"):
-            md.append("### Activity Over Time\n")
-            md.append(
+            emit("### Activity Over Time")
+            emit("")
+            emit(
                 f'<div align="center">'
                 f'<img src="{charts["activity"]}"'
-                f' alt="Activity" width="600"/></div>\n'
+                f' alt="Activity" width="600"/></div>'
             )
+            emit("")
 
-        md.append("---\n")
+        emit("---")
+        emit("")
 
         # =============================================
         #  POC OVERVIEW
         # =============================================
-        if (
-            self.poc.executive_summary
-            or self.poc.description
-            or self.poc.objectives
-        ):
-            md.append(
-                f'<h2 style="color: {self._primary_hex};">'
-                f"POC Overview</h2>\n"
-            )
-            if self.poc.executive_summary:
-                md.append("### Executive Summary\n")
-                md.append(f"{self.poc.executive_summary}\n")
-            if self.poc.description:
-                md.append("### Description\n")
-                md.append(f"{self.poc.description}\n")
-            if self.poc.objectives:
-                md.append("### Objectives\n")
-                md.append(f"{self.poc.objectives}\n")
+        if poc.executive_summary or poc.description or poc.objectives:
+            emit(f"{self._h2_open}POC Overview</h2>")
+            emit("")
+            if poc.executive_summary:
+                emit("### Executive Summary")
+                emit("")
+                emit(poc.executive_summary)
+                emit("")
+            if poc.description:
+                emit("### Description")
+                emit("")
+                emit(poc.description)
+                emit("")
+            if poc.objectives:
+                emit("### Objectives")
+                emit("")
+                emit(poc.objectives)
+                emit("")
 
         # Products
-        if self.poc.products:
-            md.append("### Products\n")
-            for product in self.poc.products:
-                md.append(f"- **{product.name}**")
-            md.append("")
+        if poc.products:
+            emit("### Products")
+            emit("")
+            for product in poc.products:
+                emit(f"- **{product.name}**")
+            emit("")
 
         # =============================================
         #  SUCCESS CRITERIA TABLE
         # =============================================
-        criteria = self.poc.success_criteria
+        criteria = poc.success_criteria
         if criteria:
-            md.append(
-                f'<h2 style="color: {self._primary_hex};">'
-                f"Success Criteria</h2>\n"
-            )
-            md.append(
-                "| # | Criteria | Target | Achieved" " | Importance | Met |"
-            )
-            md.append(
-                "|---|----------|--------|----------" "|------------|-----|"
-            )
+            emit(f"{self._h2_open}Success Criteria</h2>")
+            emit("")
+            emit("| # | Criteria | Target | Achieved" " | Importance | Met |")
+            emit("|---|----------|--------|----------" "|------------|-----|")
             for i, c in enumerate(criteria, 1):
                 stars = "★" * (c.importance_level or 3)
                 met = "✅" if c.is_met else "❌"
-                md.append(
-                    f"| {i} | {c.title}"
-                    f" | {c.target_value or 'N/A'}"
-                    f" | {c.achieved_value or 'N/A'}"
-                    f" | {stars} | {met} |"
+                emit(
+                    _MD_CRITERIA_ROW(
+                        i,
+                        c.title,
+                        c.target_value or "N/A",
+                        c.achieved_value or "N/A",
+                        stars,
+                        met,
+                    )
                 )
-            md.append("")
+            emit("")
 
         # =============================================
         #  TASKS
         # =============================================
         tasks = self._get_all_tasks()
         if tasks:
-            md.append(
-                f'<h2 style="color: {self._primary_hex};">' f"Tasks</h2>\n"
-            )
+            emit(f"{self._h2_open}Tasks</h2>")
+            emit("")
             for task in tasks:
-                md.extend(self._md_render_task(task))
+                self._md_render_task(task, buf)
 
-            md.append("---\n")
+            emit("---")
+            emit("")
 
         # =============================================
         #  TASK GROUPS
         # =============================================
         groups = self._get_all_task_groups()
         if groups:
-            md.append(
-                f'<h2 style="color: {self._primary_hex};">'
-                f"Task Groups</h2>\n"
-            )
+            emit(f"{self._h2_open}Task Groups</h2>")
+            emit("")
             for group in groups:
                 status_val = (
                     group.status.value if group.status else "not_started"
                 )
-                status_emoji = {
-                    "not_started": "⚪",
-                    "in_progress": "🔵",
-                    "completed": "✅",
-                    "blocked": "🔴",
-                }
-                emoji = status_emoji.get(status_val, "⚪")
-                md.append(
-                    f"### 📁 {group.title} — {emoji}"
-                    f" {status_val.replace('_', ' ').title()}\n"
+                emoji, label = _MD_STATUS.get(
+                    status_val, ("⚪", status_val.title())
                 )
+                emit(f"### 📁 {group.title} — {emoji} {label}")
+                emit("")
 
                 if group.description:
-                    md.append(f"{group.description}\n")
+                    emit(group.description)
+                    emit("")
 
                 # Group resources
-                group_resources = (
-                    self.db.query(Resource)
-                    .filter(Resource.poc_task_group_id == group.id)
-                    .all()
-                )
+                group_resources = self._get_group_resources(group)
                 if group_resources:
-                    md.append("**Group Resources:**")
+                    emit("**Group Resources:**")
                     for res in group_resources:
-                        md.append(
-                            f"- **{res.title}**"
-                            f" ({res.resource_type.value})"
-                        )
+                        rtype = res.resource_type.value
+                        emit(f"- **{res.title}** ({rtype})")
                         if res.description:
-                            md.append(f"  - {res.description}")
-                        if res.resource_type.value == "LINK" and res.content:
-                            md.append(f"  - Link: {res.content}")
-                    md.append("")
+                            emit(f"  - {res.description}")
+                        if rtype == "LINK" and res.content:
+                            emit(f"  - Link: {res.content}")
+                    emit("")
 
                 # Group comments
-                group_comments = (
-                    self.db.query(Comment)
-                    .filter(Comment.poc_task_group_id == group.id)
-                    .order_by(Comment.created_at.desc())
-                    .limit(5)
-                    .all()
-                )
+                group_comments = self._get_group_comments(group)
                 if group_comments:
-                    md.append("**Group Comments:**")
-                    for c in reversed(group_comments):
+                    emit("**Group Comments:**")
+                    for c in group_comments:
                         author = self._comment_author_name(c)
-                        dt = c.created_at.strftime("%Y-%m-%d %H:%M")
+                        dt = _fmt_dt(c.created_at)
                         vis = "🔒 Internal" if c.is_internal else "👁️ Public"
-                        md.append(f"- **{author}** ({vis}) — {dt}")
-                        md.append(f"  {c.content}")
-                    md.append("")
+                        emit(f"- **{author}** ({vis}) — {dt}")
+                        emit(f"  {c.content}")
+                    emit("")
 
                 # Tasks in group
                 group_tasks = self._get_group_tasks(group)
                 if group_tasks:
-                    md.append("**Tasks in this group:**\n")
+                    emit("**Tasks in this group:**")
+                    emit("")
                     for task in group_tasks:
-                        md.extend(self._md_render_task(task, level=4))
+                        self._md_render_task(task, buf, level=4)
 
-                md.append("---\n")
+                emit("---")
+                emit("")
 
         # =============================================
         #  POC-LEVEL RESOURCES
         # =============================================
         poc_resources = self._get_poc_resources()
         if poc_resources:
-            md.append(
-                f'<h2 style="color: {self._primary_hex};">'
-                f"POC Resources</h2>\n"
-            )
+            emit(f"{self._h2_open}POC Resources</h2>")
+            emit("")
             for resource in poc_resources:
-                md.append(f"### {resource.title}\n")
-                md.append(f"**Type:** {resource.resource_type.value}\n")
+                rtype = resource.resource_type.value
+                emit(f"### {resource.title}")
+                emit("")
+                emit(f"**Type:** {rtype}")
+                emit("")
                 if resource.description:
-                    md.append(f"{resource.description}\n")
-                if resource.resource_type.value == "LINK" and resource.content:
-                    md.append(f"**Link:** {resource.content}\n")
-                elif (
-                    resource.resource_type.value == "CODE" and resource.content
-                ):
-                    md.append(f"```\n{resource.content}\n```\n")
+                    emit(resource.description)
+                    emit("")
+                if rtype == "LINK" and resource.content:
+                    emit(f"**Link:** {resource.content}")
+                    emit("")
+                elif rtype == "CODE" and resource.content:
+                    emit(f"```\n{resource.content}\n```")
+                    emit("")
                 elif resource.content:
-                    md.append(f"{resource.content}\n")
-                md.append("")
+                    emit(resource.content)
+                    emit("")
+                emit("")
 
         # =============================================
         #  PARTICIPANTS
         # =============================================
         participants = self._get_participants()
         if participants:
-            md.append(
-                f'<h2 style="color: {self._primary_hex};">'
-                f"Participants</h2>\n"
-            )
-            md.append("| Name | Email | Role | Joined |")
-            md.append("|------|-------|------|--------|")
-            for p in participants:
-                if p.user:
-                    name = p.user.full_name or p.user.email
-                    email = p.user.email
-                    role_parts = []
-                    if p.is_sales_engineer:
-                        role_parts.append("Sales Engineer")
-                    if p.is_customer:
-                        role_parts.append("Customer")
-                    role = (
-                        ", ".join(role_parts) if role_parts else "Participant"
-                    )
-                    joined = (
-                        p.joined_at.strftime("%Y-%m-%d")
-                        if p.joined_at
-                        else "N/A"
-                    )
-                    md.append(f"| {name} | {email}" f" | {role} | {joined} |")
-            md.append("")
+            emit(f"{self._h2_open}Participants</h2>")
+            emit("")
+            emit("| Name | Email | Role | Joined |")
+            emit("|------|-------|------|--------|")
+            rows = self._participant_rows()
+            if rows:
+                emit("\n".join([_MD_PARTICIPANT_ROW(*r) for r in rows]))
+            emit("")
 
         # =============================================
         #  POC-LEVEL COMMENTS
         # =============================================
-        poc_comments = (
-            self.db.query(Comment)
-            .filter(
-                Comment.poc_id == self.poc.id,
-                Comment.poc_task_id.is_(None),
-                Comment.poc_task_group_id.is_(None),
-            )
-            .order_by(Comment.created_at.desc())
-            .limit(10)
-            .all()
-        )
+        poc_comments = self._get_poc_comments()
         if poc_comments:
-            md.append(
-                f'<h2 style="color: {self._primary_hex};">'
-                f"Recent POC Comments</h2>\n"
-            )
-            for c in reversed(poc_comments):
+            emit(f"{self._h2_open}Recent POC Comments</h2>")
+            emit("")
+            for c in poc_comments:
                 author = self._comment_author_name(c)
-                dt = c.created_at.strftime("%Y-%m-%d %H:%M")
+                dt = _fmt_dt(c.created_at)
                 vis = "🔒 Internal" if c.is_internal else "👁️ Public"
-                md.append(f"- **{author}** ({vis}) — {dt}")
-                md.append(f"  {c.content}")
-            md.append("")
-
-        # Write output
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(md))
-
-        return output_path
-
-    def _md_render_task(self, task, level: int = 3) -> List[str]:
-        """Render a single task to Markdown lines."""
-        lines: List[str] = []
-        status_emoji = {
-            "not_started": "⚪",
-            "in_progress": "🔵",
-            "completed": "✅",
-            "blocked": "🔴",
-        }
-        emoji = status_emoji.get(task.status.value, "⚪")
+                emit(f"- **{author}** ({vis}) — {dt}")
+                emit(f"  {c.content}")
+            emit("")
+
+    def _md_render_task(self, task, out: TextIO, level: int = 3) -> None:
+        """Write the Markdown for a single task to ``out``."""
+        w = out.write
+        status_val = task.status.value
+        emoji, label = _MD_STATUS.get(status_val, ("⚪", status_val.title()))
         heading = "#" * level
 
-        lines.append(f"{heading} {task.title}\n")
-        lines.append(
-            f"**Status:** {emoji}"
-            f" {task.status.value.replace('_', ' ').title()}\n"
-        )
+        w(f"{heading} {task.title}\n\n")
+        w(f"**Status:** {emoji} {label}\n\n")
 
         if task.description:
-            lines.append(f"{task.description}\n")
+            w(f"{task.description}\n\n")
 
         # Dates
-        date_parts = []
-        if task.start_date:
-            date_parts.append(f"**Start:** {task.start_date}")
-        if task.due_date:
-            date_parts.append(f"**Due:** {task.due_date}")
-        if task.completed_at:
-            date_parts.append(f"**Completed:** {task.completed_at}")
-        if date_parts:
-            lines.append(" | ".join(date_parts) + "\n")
+        start, due, done = task.start_date, task.due_date, task.completed_at
+        mask = bool(start) << 2 | bool(due) << 1 | bool(done)
+        if mask:
+            w(_MD_TASK_DATES[mask].format(start, due, done))
+            w("\n\n")
 
         # Assignees
-        assignees = (
-            self.db.query(POCTaskAssignee)
-            .filter(POCTaskAssignee.poc_task_id == task.id)
-            .all()
-        )
+        assignees = task.assignees
         if assignees:
-            lines.append("**Assigned to:**")
+            w("**Assigned to:**\n")
             for a in assignees:
                 if a.participant and a.participant.user:
-                    name = (
-                        a.participant.user.full_name
-                        or a.participant.user.email
-                    )
-                    lines.append(
-                        f"- 👤 {name}" f" ({a.participant.user.email})"
-                    )
-            lines.append("")
+                    user = a.participant.user
+                    name = user.full_name or user.email
+                    w(f"- 👤 {name} ({user.email})\n")
+            w("\n")
 
         # Resources
-        task_resources = (
-            self.db.query(Resource)
-            .filter(Resource.poc_task_id == task.id)
-            .all()
-        )
+        task_resources = task.resources
         if task_resources:
-            lines.append("**Resources:**")
+            w("**Resources:**\n")
             for res in task_resources:
-                lines.append(
-                    f"- **{res.title}**" f" ({res.resource_type.value})"
-                )
+                rtype = res.resource_type.value
+                w(f"- **{res.title}** ({rtype})\n")
                 if res.description:
-                    lines.append(f"  - {res.description}")
-                if res.resource_type.value == "LINK" and res.content:
-                    lines.append(f"  - Link: {res.content}")
-            lines.append("")
+                    w(f"  - {res.description}\n")
+                if rtype == "LINK" and res.content:
+                    w(f"  - Link: {res.content}\n")
+            w("\n")
 
         # Success criteria linked to this task
-        if hasattr(task, "task_criteria") and task.task_criteria:
-            lines.append("**Success Criteria:**")
-            for tc in task.task_criteria:
-                sc = (
-                    tc.success_criteria
-                    if hasattr(tc, "success_criteria")
-                    else None
-                )
+        task_criteria = task.task_criteria
+        if task_criteria:
+            w("**Success Criteria:**\n")
+            for tc in task_criteria:
+                sc = tc.success_criteria
                 if sc:
                     met = "✅" if sc.is_met else "❌"
-                    lines.append(f"- {met} {sc.title}")
-            lines.append("")
+                    w(f"- {met} {sc.title}\n")
+            w("\n")
 
         # Comments
-        comments = (
-            self.db.query(Comment)
-            .filter(Comment.poc_task_id == task.id)
-            .order_by(Comment.created_at.desc())
-            .limit(5)
-            .all()
-        )
+        comments = self._get_task_comments(task)
         if comments:
-            lines.append("**Latest Comments:**")
-            for c in reversed(comments):
+            w("**Latest Comments:**\n")
+            for c in comments:
                 author = self._comment_author_name(c)
-                dt = c.created_at.strftime("%Y-%m-%d %H:%M")
+                dt = _fmt_dt(c.created_at)
                 vis = "🔒 Internal" if c.is_internal else "👁️ Public"
-                lines.append(f"- **{author}** ({vis}) — {dt}")
-                lines.append(f"  {c.content}")
-            lines.append("")
+                w(f"- **{author}** ({vis}) — {dt}\n  {c.content}\n")
+            w("\n")
 
-        lines.append("")
-        return lines
+        w("\n")
 
     # ------------------------------------------------------------------ #
     #  Word Generation                                                     #
@@ -1878,24 +2008,33 @@ class DocumentGenerator:
 
     def generate_word(self, output_path: str):
         """Generate Word document (basic format)."""
-        doc = Document()
+        Path(output_path).write_bytes(self.generate_word_bytes())
+        return output_path
+
+    def generate_word_bytes(self) -> bytes:
+        """Render the Word document in memory and return its bytes."""
+        from docx import Document
+        from docx.shared import Inches, Pt, RGBColor
+        from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+
+        poc = self.poc
+        doc = Document(BytesIO(_word_template_bytes()))
 
         # Customer logo
-        if self.poc.customer_logo_url:
-            logo_path = self._get_logo_path(self.poc.customer_logo_url)
-            if logo_path and os.path.exists(logo_path):
-                try:
-                    logo_paragraph = doc.add_paragraph()
-                    logo_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-                    run = logo_paragraph.add_run()
-                    run.add_picture(logo_path, width=Inches(2))
-                except Exception:
-                    pass
+        logo_bytes = self._get_logo_bytes()
+        if logo_bytes:
+            try:
+                logo_paragraph = doc.add_paragraph()
+                logo_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+                run = logo_paragraph.add_run()
+                run.add_picture(BytesIO(logo_bytes), width=Inches(2))
+            except Exception:
+                pass
 
         # Customer name
         customer_para = doc.add_paragraph()
         customer_para.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-        customer_run = customer_para.add_run(self.poc.customer_company_name)
+        customer_run = customer_para.add_run(poc.customer_company_name)
         customer_run.font.size = Pt(18)
         customer_run.font.bold = True
         customer_run.font.color.rgb = RGBColor(51, 51, 51)
@@ -1903,69 +2042,50 @@ class DocumentGenerator:
         doc.add_paragraph()
 
         # Title
-        title = doc.add_heading(self.poc.title, 0)
+        title = doc.add_heading(poc.title, 0)
         title.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
 
         # POC Details
         doc.add_heading("POC Details", level=1)
-        table = doc.add_table(rows=5, cols=2)
-        table.style = "Light Grid Accent 1"
-
-        details = [
-            ("Customer", self.poc.customer_company_name),
-            ("Status", self.poc.status.value),
-            (
-                "Start Date",
-                (str(self.poc.start_date) if self.poc.start_date else "N/A"),
-            ),
-            (
-                "End Date",
-                (str(self.poc.end_date) if self.poc.end_date else "N/A"),
-            ),
+        values = (
+            poc.customer_company_name,
+            poc.status.value,
+            str(poc.start_date) if poc.start_date else "N/A",
+            str(poc.end_date) if poc.end_date else "N/A",
             (
-                "Success Score",
-                (
-                    f"{self.poc.overall_success_score}/100"
-                    if self.poc.overall_success_score
-                    else "N/A"
-                ),
+                f"{poc.overall_success_score}/100"
+                if poc.overall_success_score
+                else "N/A"
             ),
-        ]
-        for i, (label, value) in enumerate(details):
-            table.rows[i].cells[0].text = label
-            table.rows[i].cells[1].text = value
+        )
+        _add_word_table(
+            doc, list(zip(_WORD_DETAIL_LABELS, values)), "Light Grid Accent 1"
+        )
 
         # Description
-        if self.poc.description:
+        if poc.description:
             doc.add_heading("Description", level=1)
-            doc.add_paragraph(self.poc.description)
+            doc.add_paragraph(poc.description)
 
         # Success Criteria
-        if self.poc.success_criteria:
+        if poc.success_criteria:
             doc.add_heading("Success Criteria", level=1)
-            criteria_table = doc.add_table(
-                rows=len(self.poc.success_criteria) + 1, cols=4
-            )
-            criteria_table.style = "Light Grid Accent 1"
-            headers = ["Criteria", "Target", "Achieved", "Met"]
-            for i, header in enumerate(headers):
-                criteria_table.rows[0].cells[i].text = header
-            for i, criteria in enumerate(self.poc.success_criteria, 1):
-                criteria_table.rows[i].cells[0].text = criteria.title
-                criteria_table.rows[i].cells[1].text = (
-                    criteria.target_value or "N/A"
-                )
-                criteria_table.rows[i].cells[2].text = (
-                    criteria.achieved_value or "N/A"
-                )
-                criteria_table.rows[i].cells[3].text = (
-                    "Yes" if criteria.is_met else "No"
+            criteria_rows = [("Criteria", "Target", "Achieved", "Met")]
+            criteria_rows.extend(
+                (
+                    criteria.title,
+                    criteria.target_value or "N/A",
+                    criteria.achieved_value or "N/A",
+                    "Yes" if criteria.is_met else "No",
                 )
+                for criteria in poc.success_criteria
+            )
+            _add_word_table(doc, criteria_rows, "Light Grid Accent 1")
 
         # Tasks
-        if self.poc.poc_tasks:
+        if poc.poc_tasks:
             doc.add_heading("Tasks", level=1)
-            for task in self.poc.poc_tasks:
+            for task in poc.poc_tasks:
                 doc.add_heading(task.title, level=2)
                 if task.description:
                     doc.add_paragraph(task.description)
@@ -1975,22 +2095,39 @@ class DocumentGenerator:
                         f"Success Level: {task.success_level}/100"
                     )
 
-        doc.save(output_path)
-        return output_path
+        buf = BytesIO()
+        doc.save(buf)
+        return buf.getvalue()
 
     # ------------------------------------------------------------------ #
     #  Utilities                                                           #
     # ------------------------------------------------------------------ #
 
-    def _get_logo_path(self, logo_url: str) -> Optional[str]:
-        """Resolve logo URL to a local file path."""
-        from app.config import Settings
+    def _get_logo_bytes(self) -> Optional[bytes]:
+        """Return the customer logo as downscaled PNG bytes, or None."""
+        if not self.poc.customer_logo_url:
+            return None
+        logo_path = self._get_logo_path(self.poc.customer_logo_url)
+        # A single stat both checks existence and feeds the cache key.
+        try:
+            mtime = os.stat(logo_path).st_mtime
+        except OSError:
+            return None
+        try:
+            return _load_logo_png(logo_path, mtime)
+        except (OSError, UnidentifiedImageError) as e:
+            logger.warning("Failed to load customer logo %s: %s", logo_path, e)
+            return None
+
+    def _get_logo_path(self, logo_url: str) -> str:
+        """Map a logo URL to its path under UPLOAD_DIR.
 
-        settings = Settings()
+        Existence is not checked here; callers stat/open the file and handle
+        ``OSError`` instead of racing a separate exists() call.
+        """
         relative_path = logo_url.lstrip("/")
 
         if relative_path.startswith("uploads/"):
             relative_path = relative_path[8:]
 
-        logo_path = Path(settings.UPLOAD_DIR) / relative_path
-        return str(logo_path) if logo_path.exists() else None
+        return str(Path(settings.UPLOAD_DIR) / relative_path)
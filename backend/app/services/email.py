@@ -1,14 +1,50 @@
 """Email service"""
 
+import asyncio
 import logging
+from email.utils import formataddr
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig
-from typing import List
+from fastapi_mail.connection import Connection
+from fastapi_mail.fastmail import email_dispatched
+
+# MailMsg._message is private fastapi-mail API, used by send_emails to
+# send per message over one session; requirements.txt pins the version.
+from fastapi_mail.msg import MailMsg
+from typing import Any, Dict, List, Optional, Tuple
 from app.config import settings
 from app.models.tenant import Tenant
 from app.utils import decrypt_value
+from jinja2 import Environment, PackageLoader, select_autoescape
 
 logger = logging.getLogger(__name__)
 
+# HTML email bodies live in app/templates/emails. Each template is
+# compiled once per process and autoescapes the values passed to it.
+_EMAIL_TEMPLATES = Environment(
+    loader=PackageLoader("app", "templates/emails"),
+    autoescape=select_autoescape(["html"]),
+)
+
+# Base URL for the links emails point back into the app.
+_FRONTEND_URL = settings.FRONTEND_URL
+
+# Plain-text body of send_poc_update_notification.
+_POC_UPDATE_BODY = """A {update_type} has been made to POC: {poc_title}
+
+Please log in to POC Manager to view the details.
+
+Best regards,
+POC Manager Team
+"""
+
+# Caps the SMTP sessions a worker has open at once so invitation bursts
+# queue here instead of tripping server connection and rate limits.
+_SEND_SLOTS = asyncio.Semaphore(settings.MAIL_MAX_CONCURRENT_SENDS)
+
+# FastMail clients keyed by tenant id (None for the platform default),
+# each stored with the mail settings it was built from.
+_MAIL_CLIENTS: Dict[Optional[int], Tuple[Optional[tuple], FastMail]] = {}
+
 
 def get_mail_config(tenant: Tenant = None) -> ConnectionConfig:
     """Get email configuration (tenant-specific or default)"""
@@ -38,6 +74,47 @@ def get_mail_config(tenant: Tenant = None) -> ConnectionConfig:
         )
 
 
+def _render_email(template_name: str, **context) -> str:
+    """Render an HTML email body from its template"""
+    return _EMAIL_TEMPLATES.get_template(template_name).render(**context)
+
+
+def _mail_settings_key(tenant: Tenant = None) -> Optional[tuple]:
+    """The tenant's custom SMTP settings, or None for the platform default"""
+    if tenant and tenant.custom_mail_server:
+        return (
+            tenant.custom_mail_server,
+            tenant.custom_mail_port,
+            tenant.custom_mail_from,
+            tenant.custom_mail_tls,
+            tenant.custom_mail_username,
+            tenant.custom_mail_password,
+        )
+    return None
+
+
+def _get_fastmail(tenant: Tenant = None) -> FastMail:
+    """Get a cached FastMail client for the tenant's mail configuration.
+
+    The client is rebuilt whenever the tenant's SMTP settings differ from
+    the ones it was created with, so edits and key rotation take effect
+    on the next send.
+    """
+    settings_key = _mail_settings_key(tenant)
+    client_key = tenant.id if settings_key else None
+    cached = _MAIL_CLIENTS.get(client_key)
+    if cached and cached[0] == settings_key:
+        return cached[1]
+    fm = FastMail(get_mail_config(tenant))
+    _MAIL_CLIENTS[client_key] = (settings_key, fm)
+    return fm
+
+
+def _unique_recipients(recipients: List[str]) -> List[str]:
+    """Normalized addresses with blanks and repeats dropped, in order"""
+    return list(dict.fromkeys(r.strip().lower() for r in recipients if r))
+
+
 async def send_email(
     recipients: List[str],
     subject: str,
@@ -46,7 +123,10 @@ async def send_email(
     html: bool = False,
 ):
     """Send an email"""
-    config = get_mail_config(tenant)
+    recipients = _unique_recipients(recipients)
+    if not recipients:
+        logger.debug("send_email called without recipients: %s", subject)
+        return
 
     message = MessageSchema(
         subject=subject,
@@ -55,8 +135,93 @@ async def send_email(
         subtype="html" if html else "plain",
     )
 
-    fm = FastMail(config)
-    await fm.send_message(message)
+    async with _SEND_SLOTS:
+        await _get_fastmail(tenant).send_message(message)
+
+
+async def send_broadcast(
+    recipients: List[str],
+    subject: str,
+    body: str,
+    tenant: Tenant = None,
+    html: bool = False,
+):
+    """Send one identical email to many people as a single message.
+
+    Recipients go in Bcc, so the body is transferred once with one RCPT TO
+    per address and nobody sees the rest of the list. The To header reads
+    ``undisclosed-recipients:;``.
+    """
+    recipients = _unique_recipients(recipients)
+    if len(recipients) < 2:
+        await send_email(recipients, subject, body, tenant, html)
+        return
+
+    message = MessageSchema(
+        subject=subject,
+        recipients=[],
+        bcc=recipients,
+        body=body,
+        subtype="html" if html else "plain",
+    )
+
+    (error,) = await send_emails([message], tenant)
+    if error:
+        raise error
+
+
+async def send_emails(
+    messages: List[MessageSchema], tenant: Tenant = None
+) -> List[Optional[Exception]]:
+    """Send several emails over a single SMTP session.
+
+    The connection, STARTTLS and login happen once for the whole batch
+    instead of once per message. Each message is sent on its own, so one
+    rejected recipient does not stop the rest of the batch. Returns one
+    entry per message: None if the server accepted it, otherwise the
+    error. Raises if the session itself cannot be opened.
+    """
+    errors: List[Optional[Exception]] = []
+    if not messages:
+        return errors
+    config = _get_fastmail(tenant).config
+    sender = config.MAIL_FROM
+    if config.MAIL_FROM_NAME is not None:
+        sender = formataddr((config.MAIL_FROM_NAME, config.MAIL_FROM))
+
+    async with _SEND_SLOTS:
+        try:
+            async with Connection(config) as connection:
+                for message in messages:
+                    try:
+                        prepared = await MailMsg(message)._message(sender)
+                        envelope = None
+                        if not message.recipients:
+                            # Bcc-only: name no one rather than send an
+                            # empty To header, and address the envelope
+                            # explicitly since the group holds no address.
+                            prepared.replace_header(
+                                "To", "undisclosed-recipients:;"
+                            )
+                            envelope = [
+                                r.email for r in message.cc + message.bcc
+                            ]
+                        if not config.SUPPRESS_SEND:
+                            await connection.session.send_message(
+                                prepared, recipients=envelope
+                            )
+                        # Feeds FastMail.record_messages() like its own
+                        # send_message does.
+                        email_dispatched.send(prepared)
+                        errors.append(None)
+                    except Exception as e:
+                        errors.append(e)
+        except Exception as e:
+            if len(errors) < len(messages):
+                raise
+            # Every message was handed over; only QUIT failed.
+            logger.warning("SMTP session did not close cleanly: %s", e)
+    return errors
 
 
 async def send_invitation_email(
@@ -67,53 +232,27 @@ async def send_invitation_email(
 ):
     """Send Platform Admin invitation email"""
     try:
-        # Get frontend URL from environment or use default
-        from app.config import settings
-
-        frontend_url = getattr(
-            settings, "FRONTEND_URL", "http://localhost:3001"
-        )
-        invitation_url = f"{frontend_url}/accept-invitation?token={token}"
+        invitation_url = f"{_FRONTEND_URL}/accept-invitation?token={token}"
 
         subject = "Invitation to Join as Platform Admin"
-        body = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <h2 style="color: #4F46E5;">You've Been Invited!</h2>
-                <p>Hello {full_name},</p>
-                <p><strong>{invited_by}</strong> has invited you to join as a <strong>Platform Administrator</strong> for POC Manager.</p>
-                <p>As a Platform Admin, you will have access to manage tenants and platform-wide settings.</p>
-                <div style="margin: 30px 0;">
-                    <a href="{invitation_url}" 
-                       style="background-color: #4F46E5; color: white; padding: 12px 24px; 
-                              text-decoration: none; border-radius: 6px; display: inline-block;">
-                        Accept Invitation
-                    </a>
-                </div>
-                <p style="color: #666; font-size: 14px;">
-                    Or copy and paste this link into your browser:<br>
-                    <a href="{invitation_url}">{invitation_url}</a>
-                </p>
-                <p style="color: #999; font-size: 12px; margin-top: 30px;">
-                    This invitation will expire in 7 days.
-                </p>
-                <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
-                <p style="color: #666; font-size: 14px;">
-                    Best regards,<br>
-                    POC Manager Team
-                </p>
-            </body>
-        </html>
-        """
+        body = _render_email(
+            "platform_admin_invitation.html",
+            full_name=full_name,
+            invited_by=invited_by,
+            invitation_url=invitation_url,
+        )
 
         await send_email([recipient], subject, body, tenant=None, html=True)
         logger.info(
-            f"Successfully sent platform admin invitation email to {recipient}"
+            "Successfully sent platform admin invitation email to %s",
+            recipient,
         )
     except Exception as e:
         # Log error but don't crash the background task
         logger.error(
-            f"Failed to send invitation email to {recipient}: {str(e)}",
+            "Failed to send invitation email to %s: %s",
+            recipient,
+            e,
             exc_info=True,
         )
 
@@ -127,54 +266,25 @@ async def send_user_invitation_email(
 ):
     """Send user invitation email with a link to set their own password"""
     try:
-        from app.config import settings
-
-        frontend_url = getattr(
-            settings, "FRONTEND_URL", "http://localhost:3001"
-        )
-        invitation_url = f"{frontend_url}/accept-invitation?token={token}"
+        invitation_url = f"{_FRONTEND_URL}/accept-invitation?token={token}"
 
         role_display = role.replace("_", " ").title()
-        tenant_line = ""
-        if tenant:
-            tenant_line = f" for <strong>{tenant.name}</strong>"
-
         subject = "You're Invited to Join POC Manager"
-        body = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <h2 style="color: #4F46E5;">You've Been Invited!</h2>
-                <p>Hello {full_name},</p>
-                <p>You have been invited to join POC Manager as a <strong>{role_display}</strong>{tenant_line}.</p>
-                <p>Click the button below to set your password and activate your account:</p>
-                <div style="margin: 30px 0;">
-                    <a href="{invitation_url}"
-                       style="background-color: #4F46E5; color: white; padding: 12px 24px;
-                              text-decoration: none; border-radius: 6px; display: inline-block;">
-                        Accept Invitation &amp; Set Password
-                    </a>
-                </div>
-                <p style="color: #666; font-size: 14px;">
-                    Or copy and paste this link into your browser:<br>
-                    <a href="{invitation_url}">{invitation_url}</a>
-                </p>
-                <p style="color: #999; font-size: 12px; margin-top: 30px;">
-                    This invitation will expire in 7 days.
-                </p>
-                <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
-                <p style="color: #666; font-size: 14px;">
-                    Best regards,<br>
-                    POC Manager Team
-                </p>
-            </body>
-        </html>
-        """
+        body = _render_email(
+            "user_invitation.html",
+            full_name=full_name,
+            role_display=role_display,
+            tenant_name=tenant.name if tenant else None,
+            invitation_url=invitation_url,
+        )
 
         await send_email([email], subject, body, tenant, html=True)
-        logger.info(f"Successfully sent user invitation email to {email}")
+        logger.info("Successfully sent user invitation email to %s", email)
     except Exception as e:
         logger.error(
-            f"Failed to send user invitation email to {email}: {str(e)}",
+            "Failed to send user invitation email to %s: %s",
+            email,
+            e,
             exc_info=True,
         )
 
@@ -187,16 +297,41 @@ async def send_poc_update_notification(
 ):
     """Send POC update notification"""
     subject = f"POC Update: {poc_title}"
-    body = f"""
-    A {update_type} has been made to POC: {poc_title}
-    
-    Please log in to POC Manager to view the details.
-    
-    Best regards,
-    POC Manager Team
-    """
+    body = _POC_UPDATE_BODY.format(
+        update_type=update_type, poc_title=poc_title
+    )
+
+    await send_broadcast(recipients, subject, body, tenant)
+
+
+def _poc_invitation_message(
+    recipient: str,
+    full_name: str,
+    poc_title: str,
+    token: str,
+    invited_by_name: str,
+    personal_message: str = None,
+) -> MessageSchema:
+    """Build the POC invitation email for one recipient"""
+    invitation_url = f"{_FRONTEND_URL}/poc-invitation?token={token}"
 
-    await send_email(recipients, subject, body, tenant)
+    subject = f"Invitation to Join POC: {poc_title}"
+
+    body = _render_email(
+        "poc_invitation.html",
+        full_name=full_name,
+        invited_by_name=invited_by_name,
+        poc_title=poc_title,
+        personal_message=personal_message,
+        invitation_url=invitation_url,
+    )
+
+    return MessageSchema(
+        subject=subject,
+        recipients=[recipient],
+        body=body,
+        subtype="html",
+    )
 
 
 async def send_poc_invitation_email(
@@ -210,118 +345,57 @@ async def send_poc_invitation_email(
 ):
     """Send POC invitation email"""
     try:
-        from app.config import settings
-
-        frontend_url = getattr(
-            settings, "FRONTEND_URL", "http://localhost:3001"
-        )
-        invitation_url = f"{frontend_url}/poc-invitation?token={token}"
-
-        subject = f"Invitation to Join POC: {poc_title}"
-
-        personal_msg_html = ""
-        if personal_message:
-            personal_msg_html = f"""
-            <div style="background-color: #F3F4F6; padding: 15px; border-radius: 6px; margin: 20px 0;">
-                <p style="margin: 0; font-style: italic; color: #374151;">"{personal_message}"</p>
-            </div>
-            """
-
-        body = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <h2 style="color: #4F46E5;">You've Been Invited to Join a POC!</h2>
-                <p>Hello {full_name},</p>
-                <p><strong>{invited_by_name}</strong> has invited you to participate in the following Proof of Concept:</p>
-                <div style="background-color: #EEF2FF; padding: 15px; border-radius: 6px; margin: 20px 0;">
-                    <h3 style="margin: 0 0 10px 0; color: #4F46E5;">{poc_title}</h3>
-                </div>
-                {personal_msg_html}
-                <p>As a participant, you'll be able to:</p>
-                <ul>
-                    <li>View POC objectives and success criteria</li>
-                    <li>Track progress and milestones</li>
-                    <li>Provide feedback and updates</li>
-                    <li>Collaborate with the team</li>
-                </ul>
-                <div style="margin: 30px 0;">
-                    <a href="{invitation_url}" 
-                       style="background-color: #4F46E5; color: white; padding: 12px 24px; 
-                              text-decoration: none; border-radius: 6px; display: inline-block;">
-                        Accept Invitation
-                    </a>
-                </div>
-                <p style="color: #666; font-size: 14px;">
-                    Or copy and paste this link into your browser:<br>
-                    <a href="{invitation_url}">{invitation_url}</a>
-                </p>
-                <p style="color: #999; font-size: 12px; margin-top: 30px;">
-                    This invitation will expire in 24 hours.
-                </p>
-                <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
-                <p style="color: #666; font-size: 14px;">
-                    Best regards,<br>
-                    POC Manager Team
-                </p>
-            </body>
-        </html>
-        """
-
-        await send_email([recipient], subject, body, tenant, html=True)
+        message = _poc_invitation_message(
+            recipient,
+            full_name,
+            poc_title,
+            token,
+            invited_by_name,
+            personal_message,
+        )
+        (error,) = await send_emails([message], tenant)
+        if error:
+            raise error
         logger.info(
-            f"Successfully sent POC invitation email to {recipient} for POC: {poc_title}"
+            "Successfully sent POC invitation email to %s for POC: %s",
+            recipient,
+            poc_title,
         )
         return True
     except Exception as e:
-        error_msg = (
-            f"Failed to send POC invitation email to {recipient}: {str(e)}"
+        logger.error(
+            "Failed to send POC invitation email to %s: %s",
+            recipient,
+            e,
+            exc_info=True,
         )
-        logger.error(error_msg, exc_info=True)
         return False
 
 
-async def send_poc_invitation_email_with_tracking(
-    invitation_id: int,
-    recipient: str,
-    full_name: str,
-    poc_title: str,
-    token: str,
-    invited_by_name: str,
-    personal_message: str = None,
-    tenant: Tenant = None,
-):
-    """
-    Send POC invitation email and update the database with delivery status.
-    This wrapper function should be used in background tasks to ensure proper tracking.
+def _record_invitation_delivery(outcomes: Dict[int, bool]):
+    """Store email delivery outcomes on POC invitations in one commit.
+
+    ``outcomes`` maps invitation id to whether its email was sent.
+    Blocking database I/O: async callers run it with asyncio.to_thread.
     """
     from app.database import SessionLocal
     from app.models.poc_invitation import POCInvitation, POCInvitationStatus
 
-    # Send the email
-    success = await send_poc_invitation_email(
-        recipient=recipient,
-        full_name=full_name,
-        poc_title=poc_title,
-        token=token,
-        invited_by_name=invited_by_name,
-        personal_message=personal_message,
-        tenant=tenant,
-    )
-
-    # Update the invitation record
     db = SessionLocal()
     try:
-        invitation = (
+        invitations = (
             db.query(POCInvitation)
-            .filter(POCInvitation.id == invitation_id)
-            .first()
+            .filter(POCInvitation.id.in_(list(outcomes)))
+            .all()
         )
-        if invitation:
+        for invitation in invitations:
+            success = outcomes[invitation.id]
             invitation.email_sent = success
             if success:
                 invitation.email_error = None
                 logger.info(
-                    f"Updated invitation {invitation_id} - email sent successfully"
+                    "Updated invitation %s - email sent successfully",
+                    invitation.id,
                 )
             else:
                 invitation.email_error = (
@@ -329,16 +403,20 @@ async def send_poc_invitation_email_with_tracking(
                 )
                 invitation.status = POCInvitationStatus.FAILED
                 logger.error(
-                    f"Updated invitation {invitation_id} - marked as FAILED"
+                    "Updated invitation %s - marked as FAILED", invitation.id
                 )
-            db.commit()
-        else:
+        db.commit()
+        missing = set(outcomes) - {i.id for i in invitations}
+        for invitation_id in sorted(missing):
             logger.warning(
-                f"Could not find invitation {invitation_id} to update email status"
+                "Could not find invitation %s to update email status",
+                invitation_id,
             )
     except Exception as e:
         logger.error(
-            f"Failed to update invitation {invitation_id} email status: {str(e)}",
+            "Failed to update invitations %s email status: %s",
+            sorted(outcomes),
+            e,
             exc_info=True,
         )
         db.rollback()
@@ -346,61 +424,105 @@ async def send_poc_invitation_email_with_tracking(
         db.close()
 
 
+async def send_poc_invitation_email_with_tracking(
+    invitation_id: int,
+    recipient: str,
+    full_name: str,
+    poc_title: str,
+    token: str,
+    invited_by_name: str,
+    personal_message: str = None,
+    tenant: Tenant = None,
+):
+    """
+    Send POC invitation email and update the database with delivery status.
+    This wrapper function should be used in background tasks to ensure proper tracking.
+    """
+    await send_poc_invitations_batch(
+        [
+            {
+                "invitation_id": invitation_id,
+                "recipient": recipient,
+                "full_name": full_name,
+                "poc_title": poc_title,
+                "token": token,
+                "invited_by_name": invited_by_name,
+                "personal_message": personal_message,
+            }
+        ],
+        tenant,
+    )
+
+
+async def send_poc_invitations_batch(
+    invitations: List[Dict[str, Any]],
+    tenant: Tenant = None,
+):
+    """
+    Send several POC invitation emails over one SMTP session and record
+    each invitation's delivery status in a single commit.
+
+    Each item holds ``invitation_id`` plus the keyword arguments of
+    send_poc_invitation_email() other than ``tenant``. All invitations
+    in the batch share the tenant's mail configuration.
+    """
+    if not invitations:
+        return
+    try:
+        messages = [
+            _poc_invitation_message(
+                **{k: v for k, v in i.items() if k != "invitation_id"}
+            )
+            for i in invitations
+        ]
+        errors = await send_emails(messages, tenant)
+    except Exception as e:
+        errors = [e] * len(invitations)
+
+    outcomes = {}
+    for invitation, error in zip(invitations, errors):
+        if error is None:
+            logger.info(
+                "Successfully sent POC invitation email to %s for POC: %s",
+                invitation["recipient"],
+                invitation["poc_title"],
+            )
+        else:
+            logger.error(
+                "Failed to send POC invitation email to %s: %s",
+                invitation["recipient"],
+                error,
+            )
+        outcomes[invitation["invitation_id"]] = error is None
+
+    await asyncio.to_thread(_record_invitation_delivery, outcomes)
+
+
 async def send_password_reset_email(
     recipient: str, full_name: str, token: str, tenant: Tenant = None
 ):
     """Send password reset email"""
     try:
-        from app.config import settings
-
-        frontend_url = getattr(
-            settings, "FRONTEND_URL", "http://localhost:3001"
-        )
-        reset_url = f"{frontend_url}/reset-password?token={token}"
+        reset_url = f"{_FRONTEND_URL}/reset-password?token={token}"
 
         subject = "Password Reset Request"
 
-        body = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <h2 style="color: #4F46E5;">Password Reset Request</h2>
-                <p>Hello {full_name},</p>
-                <p>We received a request to reset your password for your POC Manager account.</p>
-                <p>Click the button below to reset your password:</p>
-                <div style="margin: 30px 0;">
-                    <a href="{reset_url}" 
-                       style="background-color: #4F46E5; color: white; padding: 12px 24px; 
-                              text-decoration: none; border-radius: 6px; display: inline-block;">
-                        Reset Password
-                    </a>
-                </div>
-                <p style="color: #666; font-size: 14px;">
-                    Or copy and paste this link into your browser:<br>
-                    <a href="{reset_url}">{reset_url}</a>
-                </p>
-                <p style="color: #DC2626; font-size: 14px; margin-top: 30px;">
-                    <strong>Important:</strong> This link will expire in 1 hour for security reasons.
-                </p>
-                <p style="color: #666; font-size: 14px;">
-                    If you didn't request this password reset, please ignore this email. Your password will remain unchanged.
-                </p>
-                <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
-                <p style="color: #666; font-size: 14px;">
-                    Best regards,<br>
-                    POC Manager Team
-                </p>
-            </body>
-        </html>
-        """
+        body = _render_email(
+            "password_reset.html",
+            full_name=full_name,
+            reset_url=reset_url,
+        )
 
         await send_email([recipient], subject, body, tenant, html=True)
-        logger.info(f"Successfully sent password reset email to {recipient}")
+        logger.info("Successfully sent password reset email to %s", recipient)
         return True
     except Exception as e:
-        error_msg = (
-            f"Failed to send password reset email to {recipient}: {str(e)}"
+        logger.error(
+            "Failed to send password reset email to %s: %s",
+            recipient,
+            e,
+            exc_info=True,
         )
-        logger.error(error_msg, exc_info=True)
         return False
 
 
@@ -411,58 +533,69 @@ async def send_demo_verification_email(
 ):
     """Send email verification for demo account request"""
     try:
-        from app.config import settings
-
-        frontend_url = getattr(
-            settings, "FRONTEND_URL", "http://localhost:3001"
-        )
-        verification_url = f"{frontend_url}/verify-demo-email?token={token}"
+        verification_url = f"{_FRONTEND_URL}/verify-demo-email?token={token}"
 
         subject = "Verify Your Demo Account Request"
-        body = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <h2 style="color: #4F46E5;">Welcome to POC Manager!</h2>
-                <p>Hello {name},</p>
-                <p>Thank you for requesting a demo account. Please verify your email address to continue setting up your account.</p>
-                <div style="margin: 30px 0;">
-                    <a href="{verification_url}" 
-                       style="background-color: #4F46E5; color: white; padding: 12px 24px; 
-                              text-decoration: none; border-radius: 6px; display: inline-block;">
-                        Verify Email Address
-                    </a>
-                </div>
-                <p style="color: #666; font-size: 14px;">
-                    Or copy and paste this link into your browser:<br>
-                    <a href="{verification_url}">{verification_url}</a>
-                </p>
-                <p style="color: #999; font-size: 12px; margin-top: 30px;">
-                    This verification link will expire in 24 hours.
-                </p>
-                <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
-                <p style="color: #666; font-size: 14px;">
-                    Best regards,<br>
-                    POC Manager Team
-                </p>
-            </body>
-        </html>
-        """
+        body = _render_email(
+            "demo_verification.html",
+            name=name,
+            verification_url=verification_url,
+        )
 
         await send_email([recipient], subject, body, None, html=True)
         logger.info(
-            f"Successfully sent demo verification email to {recipient}"
+            "Successfully sent demo verification email to %s", recipient
         )
         return True
     except Exception as e:
-        error_msg = (
-            f"Failed to send demo verification email to {recipient}: {str(e)}"
+        logger.error(
+            "Failed to send demo verification email to %s: %s",
+            recipient,
+            e,
+            exc_info=True,
         )
-        logger.error(error_msg, exc_info=True)
         return False
 
 
+async def _send_to_admins(
+    admin_emails: List[str], subject: str, body: str, kind: str
+) -> bool:
+    """Send one copy of an HTML email to each platform admin.
+
+    A refused address does not stop delivery to the others; failures are
+    logged per address. Returns True only if every admin was reached.
+    """
+    errors = await send_emails(
+        [
+            MessageSchema(
+                subject=subject,
+                recipients=[admin_email],
+                body=body,
+                subtype="html",
+            )
+            for admin_email in admin_emails
+        ]
+    )
+    failed = []
+    for admin_email, error in zip(admin_emails, errors):
+        if error is None:
+            logger.info("Successfully sent %s email to %s", kind, admin_email)
+        else:
+            logger.error(
+                "Failed to send %s email to %s: %s", kind, admin_email, error
+            )
+            failed.append(admin_email)
+    if failed:
+        logger.error(
+            "%s email not delivered to: %s",
+            kind.capitalize(),
+            ", ".join(failed),
+        )
+    return not failed
+
+
 async def send_demo_account_started_email(
-    admin_email: str,
+    admin_emails: List[str],
     name: str,
     email: str,
     company_name: str,
@@ -470,43 +603,27 @@ async def send_demo_account_started_email(
     pocs_per_quarter: int,
     existing_user: bool,
 ):
-    """Send demo account start notification to platform admin"""
+    """Send demo account start notification to each platform admin"""
     try:
         subject = f"New Demo Account Registration: {company_name}"
         existing_user_label = "Yes" if existing_user else "No"
-        body = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <h2 style="color: #4F46E5;">New Demo Account Started</h2>
-                <p>A new demo account registration has been submitted with the following details:</p>
-
-                <div style="background-color: #f8f9fa; padding: 20px; border-radius: 8px; margin: 20px 0;">
-                    <p style="margin: 5px 0;"><strong>Name:</strong> {name}</p>
-                    <p style="margin: 5px 0;"><strong>Email:</strong> {email}</p>
-                    <p style="margin: 5px 0;"><strong>Company:</strong> {company_name}</p>
-                    <p style="margin: 5px 0;"><strong>Sales Engineers:</strong> {sales_engineers_count}</p>
-                    <p style="margin: 5px 0;"><strong>POCs per Quarter:</strong> {pocs_per_quarter}</p>
-                    <p style="margin: 5px 0;"><strong>Existing User:</strong> {existing_user_label}</p>
-                </div>
-
-                <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
-                <p style="color: #666; font-size: 14px;">
-                    POC Manager Platform Administration
-                </p>
-            </body>
-        </html>
-        """
-
-        await send_email([admin_email], subject, body, None, html=True)
-        logger.info(
-            "Successfully sent demo account started email to %s for %s",
-            admin_email,
-            company_name,
+        body = _render_email(
+            "demo_account_started.html",
+            name=name,
+            email=email,
+            company_name=company_name,
+            sales_engineers_count=sales_engineers_count,
+            pocs_per_quarter=pocs_per_quarter,
+            existing_user_label=existing_user_label,
+        )
+
+        return await _send_to_admins(
+            admin_emails, subject, body, "demo account started"
         )
-        return True
     except Exception as e:
-        error_msg = f"Failed to send demo account started email: {str(e)}"
-        logger.error(error_msg, exc_info=True)
+        logger.error(
+            "Failed to send demo account started email: %s", e, exc_info=True
+        )
         return False
 
 
@@ -518,134 +635,61 @@ async def send_demo_welcome_email(
 ):
     """Send welcome email after demo account setup"""
     try:
-        from app.config import settings
-
-        frontend_url = getattr(
-            settings, "FRONTEND_URL", "http://localhost:3001"
-        )
-        login_url = f"{frontend_url}/login"
+        login_url = f"{_FRONTEND_URL}/login"
 
         subject = "Welcome to Your POC Manager Demo Account!"
-        body = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <h2 style="color: #4F46E5;">Your Demo Account is Ready! 🎉</h2>
-                <p>Hello {name},</p>
-                <p>Your demo account for <strong>{company_name}</strong> has been successfully created and is ready to use!</p>
-                
-                <div style="background-color: #f8f9fa; padding: 20px; border-radius: 8px; margin: 20px 0;">
-                    <h3 style="margin-top: 0; color: #4F46E5;">What's Included in Your Demo:</h3>
-                    <ul style="line-height: 1.8;">
-                        <li>Pre-configured users across all roles (Tenant Admin, Administrator, Sales Engineers, Customers)</li>
-                        <li>Sample task templates and task groups ready to use</li>
-                        <li>2 complete POC examples with success criteria</li>
-                        <li>Full access to all POC management features</li>
-                    </ul>
-                </div>
-                
-                <div style="background-color: #fff3cd; padding: 20px; border-radius: 8px; margin: 20px 0; border-left: 4px solid #ffc107;">
-                    <h3 style="margin-top: 0; color: #856404;">Demo Account Limits:</h3>
-                    <ul style="line-height: 1.8; color: #856404;">
-                        <li><strong>Maximum 2 POCs</strong></li>
-                        <li><strong>Maximum 20 tasks</strong></li>
-                        <li><strong>Maximum 20 task groups</strong></li>
-                        <li><strong>Maximum 10 resources/uploads total</strong></li>
-                    </ul>
-                    <p style="margin-bottom: 0; color: #856404;">
-                        <strong>Ready to grow?</strong> You can request to convert your demo account to a full account at any time from your tenant settings.
-                    </p>
-                </div>
-                
-                <div style="margin: 30px 0;">
-                    <a href="{login_url}" 
-                       style="background-color: #4F46E5; color: white; padding: 12px 24px; 
-                              text-decoration: none; border-radius: 6px; display: inline-block; font-weight: bold;">
-                        Access Your Demo Account
-                    </a>
-                </div>
-                
-                <p style="color: #666; font-size: 14px; margin-top: 30px;">
-                    Your tenant identifier: <strong>{tenant_slug}</strong>
-                </p>
-                
-                <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
-                <p style="color: #666; font-size: 14px;">
-                    Best regards,<br>
-                    POC Manager Team
-                </p>
-            </body>
-        </html>
-        """
+        body = _render_email(
+            "demo_welcome.html",
+            name=name,
+            company_name=company_name,
+            login_url=login_url,
+            tenant_slug=tenant_slug,
+        )
 
         await send_email([recipient], subject, body, None, html=True)
-        logger.info(f"Successfully sent demo welcome email to {recipient}")
+        logger.info("Successfully sent demo welcome email to %s", recipient)
         return True
     except Exception as e:
-        error_msg = (
-            f"Failed to send demo welcome email to {recipient}: {str(e)}"
+        logger.error(
+            "Failed to send demo welcome email to %s: %s",
+            recipient,
+            e,
+            exc_info=True,
         )
-        logger.error(error_msg, exc_info=True)
         return False
 
 
 async def send_demo_conversion_request_email(
-    admin_email: str,
+    admin_emails: List[str],
     tenant_name: str,
     requested_by_name: str,
     requested_by_email: str,
     reason: str,
     request_id: int,
 ):
-    """Send demo conversion request to platform admin"""
+    """Send demo conversion request to each platform admin"""
     try:
-        from app.config import settings
+        approval_url = f"{_FRONTEND_URL}/admin/demo-conversions/{request_id}"
 
-        frontend_url = getattr(
-            settings, "FRONTEND_URL", "http://localhost:3001"
+        subject = f"Demo Conversion Request: {tenant_name}"
+        body = _render_email(
+            "demo_conversion_request.html",
+            tenant_name=tenant_name,
+            requested_by_name=requested_by_name,
+            requested_by_email=requested_by_email,
+            reason=reason,
+            approval_url=approval_url,
         )
-        approval_url = f"{frontend_url}/admin/demo-conversions/{request_id}"
 
-        subject = f"Demo Conversion Request: {tenant_name}"
-        body = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <h2 style="color: #4F46E5;">Demo Account Conversion Request</h2>
-                <p>A demo account has requested conversion to a full account:</p>
-                
-                <div style="background-color: #f8f9fa; padding: 20px; border-radius: 8px; margin: 20px 0;">
-                    <p style="margin: 5px 0;"><strong>Tenant:</strong> {tenant_name}</p>
-                    <p style="margin: 5px 0;"><strong>Requested By:</strong> {requested_by_name} ({requested_by_email})</p>
-                    {f'<p style="margin: 5px 0;"><strong>Reason:</strong> {reason}</p>' if reason else ''}
-                </div>
-                
-                <div style="margin: 30px 0;">
-                    <a href="{approval_url}" 
-                       style="background-color: #4F46E5; color: white; padding: 12px 24px; 
-                              text-decoration: none; border-radius: 6px; display: inline-block;">
-                        Review Request
-                    </a>
-                </div>
-                
-                <p style="color: #666; font-size: 14px;">
-                    Click the button above to approve or reject this conversion request.
-                </p>
-                
-                <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
-                <p style="color: #666; font-size: 14px;">
-                    POC Manager Platform Administration
-                </p>
-            </body>
-        </html>
-        """
-
-        await send_email([admin_email], subject, body, None, html=True)
-        logger.info(
-            f"Successfully sent demo conversion request email to {admin_email} for tenant {tenant_name}"
+        return await _send_to_admins(
+            admin_emails, subject, body, "demo conversion request"
         )
-        return True
     except Exception as e:
-        error_msg = f"Failed to send demo conversion request email: {str(e)}"
-        logger.error(error_msg, exc_info=True)
+        logger.error(
+            "Failed to send demo conversion request email: %s",
+            e,
+            exc_info=True,
+        )
         return False
 
 
@@ -655,73 +699,29 @@ async def send_existing_account_notification_email(
 ):
     """Send notification to existing account holder that someone tried to create a demo with their email"""
     try:
-        from app.config import settings
-
-        frontend_url = getattr(
-            settings, "FRONTEND_URL", "http://localhost:3001"
-        )
-        login_url = f"{frontend_url}/login"
-        reset_password_url = f"{frontend_url}/forgot-password"
+        login_url = f"{_FRONTEND_URL}/login"
+        reset_password_url = f"{_FRONTEND_URL}/forgot-password"
 
         subject = "Demo Account Request Notification"
-        body = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <h2 style="color: #4F46E5;">Account Already Exists</h2>
-                <p>Hello {full_name},</p>
-                
-                <p>We received a request to create a demo account using your email address. 
-                However, an account with this email already exists in our system.</p>
-                
-                <div style="background-color: #fff3cd; padding: 15px; border-left: 4px solid #ffc107; margin: 20px 0;">
-                    <p style="margin: 0;"><strong>⚠️ If this was you:</strong></p>
-                    <p style="margin: 10px 0 0 0;">You can log in to your existing account using the button below.</p>
-                </div>
-                
-                <div style="margin: 30px 0;">
-                    <a href="{login_url}" 
-                       style="background-color: #4F46E5; color: white; padding: 12px 24px; 
-                              text-decoration: none; border-radius: 6px; display: inline-block;">
-                        Log In to Your Account
-                    </a>
-                </div>
-                
-                <div style="background-color: #e7f3ff; padding: 15px; border-left: 4px solid #2196F3; margin: 20px 0;">
-                    <p style="margin: 0;"><strong>🔑 Forgot your password?</strong></p>
-                    <p style="margin: 10px 0 0 0;">
-                        No problem! You can reset it here: 
-                        <a href="{reset_password_url}" style="color: #2196F3;">Reset Password</a>
-                    </p>
-                </div>
-                
-                <div style="background-color: #ffebee; padding: 15px; border-left: 4px solid #f44336; margin: 20px 0;">
-                    <p style="margin: 0;"><strong>🚨 If this was NOT you:</strong></p>
-                    <p style="margin: 10px 0 0 0;">
-                        Someone may have tried to use your email address. Your account is secure, 
-                        but we recommend changing your password as a precaution.
-                    </p>
-                </div>
-                
-                <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
-                <p style="color: #666; font-size: 14px;">
-                    If you have any questions or concerns, please contact our support team.<br><br>
-                    Best regards,<br>
-                    POC Manager Team
-                </p>
-            </body>
-        </html>
-        """
+        body = _render_email(
+            "existing_account.html",
+            full_name=full_name,
+            login_url=login_url,
+            reset_password_url=reset_password_url,
+        )
 
         await send_email([recipient], subject, body, None, html=True)
         logger.info(
-            f"Successfully sent existing account notification email to {recipient}"
+            "Successfully sent existing account notification email to %s",
+            recipient,
         )
         return True
     except Exception as e:
-        error_msg = (
-            f"Failed to send existing account notification email: {str(e)}"
+        logger.error(
+            "Failed to send existing account notification email: %s",
+            e,
+            exc_info=True,
         )
-        logger.error(error_msg, exc_info=True)
         return False
 
 
@@ -734,55 +734,25 @@ async def send_tenant_invitation_email(
 ):
     """Send tenant invitation email to existing user"""
     try:
-        from app.config import settings
-
-        frontend_url = getattr(
-            settings, "FRONTEND_URL", "http://localhost:3001"
-        )
-        invitation_url = f"{frontend_url}/tenant-invitation?token={token}"
+        invitation_url = f"{_FRONTEND_URL}/tenant-invitation?token={token}"
 
         subject = f"Invitation to Join {tenant_name}"
-        body = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <h2 style="color: #4F46E5;">You've Been Invited to Join a Tenant!</h2>
-                <p>Hello,</p>
-                <p><strong>{invited_by}</strong> has invited you to join <strong>{tenant_name}</strong> as a <strong>{role}</strong>.</p>
-                <p>Since you already have a POC Manager account, you can accept this invitation to gain access to this tenant with the new role.</p>
-                <div style="background-color: #EEF2FF; padding: 15px; border-radius: 6px; margin: 20px 0;">
-                    <p style="margin: 5px 0;"><strong>Tenant:</strong> {tenant_name}</p>
-                    <p style="margin: 5px 0;"><strong>Role:</strong> {role}</p>
-                    <p style="margin: 5px 0;"><strong>Invited by:</strong> {invited_by}</p>
-                </div>
-                <div style="margin: 30px 0;">
-                    <a href="{invitation_url}" 
-                       style="background-color: #4F46E5; color: white; padding: 12px 24px; 
-                              text-decoration: none; border-radius: 6px; display: inline-block;">
-                        Accept Invitation
-                    </a>
-                </div>
-                <p style="color: #666; font-size: 14px;">
-                    Or copy and paste this link into your browser:<br>
-                    <a href="{invitation_url}">{invitation_url}</a>
-                </p>
-                <p style="color: #999; font-size: 12px; margin-top: 30px;">
-                    This invitation will expire in 7 days. You'll need to log in to accept this invitation.
-                </p>
-                <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
-                <p style="color: #666; font-size: 14px;">
-                    Best regards,<br>
-                    POC Manager Team
-                </p>
-            </body>
-        </html>
-        """
+        body = _render_email(
+            "tenant_invitation.html",
+            invited_by=invited_by,
+            tenant_name=tenant_name,
+            role=role,
+            invitation_url=invitation_url,
+        )
 
         await send_email([recipient], subject, body, tenant=None, html=True)
         logger.info(
-            f"Successfully sent tenant invitation email to {recipient}"
+            "Successfully sent tenant invitation email to %s", recipient
         )
     except Exception as e:
         logger.error(
-            f"Failed to send tenant invitation email to {recipient}: {str(e)}",
+            "Failed to send tenant invitation email to %s: %s",
+            recipient,
+            e,
             exc_info=True,
         )
@@ -8,15 +8,15 @@ import matplotlib
 
 matplotlib.use("Agg")  # Non-interactive backend for server-side rendering
 
-import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.figure import Figure
 from matplotlib.patches import FancyBboxPatch
 import numpy as np
 from io import BytesIO
 import base64
 import tempfile
 import os
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import date, datetime
 
 
@@ -52,56 +52,53 @@ def _apply_theme(fig, ax, primary_color: str = "#0066cc"):
             spine.set_linewidth(0.5)
 
 
-def _save_chart(fig, as_base64: bool = False, dpi: int = 150) -> str:
-    """Save chart to a temp file path or return base64 data URI.
+def _save_chart(
+    fig, as_base64: bool = False, dpi: int = 150, return_bytes: bool = False
+):
+    """Save chart to a temp file path, a base64 data URI, or PNG bytes.
 
     Args:
         fig: matplotlib figure
         as_base64: If True, return base64 data URI; if False, return temp file path
         dpi: Resolution
+        return_bytes: If True, return an in-memory PNG (BytesIO) instead
 
     Returns:
-        File path string or base64 data URI string
+        File path string, base64 data URI string, or BytesIO
     """
-    if as_base64:
+    save_kwargs = dict(
+        format="png",
+        dpi=dpi,
+        bbox_inches="tight",
+        facecolor=fig.get_facecolor(),
+        edgecolor="none",
+    )
+    if return_bytes or as_base64:
         buf = BytesIO()
-        fig.savefig(
-            buf,
-            format="png",
-            dpi=dpi,
-            bbox_inches="tight",
-            facecolor=fig.get_facecolor(),
-            edgecolor="none",
-        )
+        fig.savefig(buf, **save_kwargs)
         buf.seek(0)
+        if return_bytes:
+            return buf
         encoded = base64.b64encode(buf.read()).decode("utf-8")
-        plt.close(fig)
         return f"data:image/png;base64,{encoded}"
-    else:
-        tmp = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
-        fig.savefig(
-            tmp.name,
-            format="png",
-            dpi=dpi,
-            bbox_inches="tight",
-            facecolor=fig.get_facecolor(),
-            edgecolor="none",
-        )
-        plt.close(fig)
-        return tmp.name
+    tmp = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
+    fig.savefig(tmp.name, **save_kwargs)
+    return tmp.name
 
 
 def generate_task_status_pie_chart(
     status_counts: Dict[str, int],
     primary_color: str = "#0066cc",
     as_base64: bool = False,
-) -> Optional[str]:
+    return_bytes: bool = False,
+) -> Optional[Union[str, BytesIO]]:
     """Generate a donut/pie chart showing task status distribution.
 
     Args:
         status_counts: Dict mapping status string to count, e.g. {"completed": 5, "in_progress": 3}
         primary_color: Tenant primary color for theming
         as_base64: Return base64 data URI if True, else temp file path
+        return_bytes: Return an in-memory PNG (BytesIO) instead
 
     Returns:
         File path or base64 string, or None if no data
@@ -118,7 +115,8 @@ def generate_task_status_pie_chart(
     chart_colors = [STATUS_COLORS.get(k, "#9CA3AF") for k in filtered]
     total = sum(sizes)
 
-    fig, ax = plt.subplots(1, 1, figsize=(5, 4))
+    fig = Figure(figsize=(5, 4))
+    ax = fig.subplots(1, 1)
     _apply_theme(fig, None, primary_color)
     fig.patch.set_facecolor("#FFFFFF")
 
@@ -176,20 +174,22 @@ def generate_task_status_pie_chart(
         pad=15,
     )
 
-    return _save_chart(fig, as_base64)
+    return _save_chart(fig, as_base64, return_bytes=return_bytes)
 
 
 def generate_success_criteria_chart(
     criteria_data: List[Dict],
     primary_color: str = "#0066cc",
     as_base64: bool = False,
-) -> Optional[str]:
+    return_bytes: bool = False,
+) -> Optional[Union[str, BytesIO]]:
     """Generate horizontal bar chart for success criteria achievement.
 
     Args:
         criteria_data: List of dicts with keys: title, target_value, achieved_value, is_met, importance_level
         primary_color: Tenant primary color
         as_base64: Return base64 if True
+        return_bytes: Return an in-memory PNG (BytesIO) instead
 
     Returns:
         File path or base64 string, or None if no data
@@ -241,7 +241,8 @@ def generate_success_criteria_chart(
 
     n = len(numeric_criteria)
     fig_height = max(3, n * 0.8 + 1.5)
-    fig, ax = plt.subplots(1, 1, figsize=(7, fig_height))
+    fig = Figure(figsize=(7, fig_height))
+    ax = fig.subplots(1, 1)
     _apply_theme(fig, ax, primary_color)
 
     titles = [c["title"] for c in reversed(numeric_criteria)]
@@ -297,8 +298,8 @@ def generate_success_criteria_chart(
     ax.legend(loc="lower right", fontsize=9, frameon=True, facecolor="white")
     ax.grid(axis="x", alpha=0.3, linestyle="--")
 
-    plt.tight_layout()
-    return _save_chart(fig, as_base64)
+    fig.tight_layout()
+    return _save_chart(fig, as_base64, return_bytes=return_bytes)
 
 
 def generate_progress_gauge(
@@ -306,7 +307,8 @@ def generate_progress_gauge(
     success_score: Optional[int] = None,
     primary_color: str = "#0066cc",
     as_base64: bool = False,
-) -> Optional[str]:
+    return_bytes: bool = False,
+) -> Optional[Union[str, BytesIO]]:
     """Generate a semi-circular gauge showing overall POC progress.
 
     Args:
@@ -314,15 +316,13 @@ def generate_progress_gauge(
         success_score: Overall success score (0-100), optional
         primary_color: Tenant primary color
         as_base64: Return base64 if True
+        return_bytes: Return an in-memory PNG (BytesIO) instead
 
     Returns:
         File path or base64 string
     """
-    fig, axes = plt.subplots(
-        1,
-        2 if success_score is not None else 1,
-        figsize=(8 if success_score is not None else 4, 3.5),
-    )
+    fig = Figure(figsize=(8 if success_score is not None else 4, 3.5))
+    axes = fig.subplots(1, 2 if success_score is not None else 1)
     fig.patch.set_facecolor("#FFFFFF")
 
     if success_score is not None:
@@ -394,8 +394,8 @@ def generate_progress_gauge(
     if success_score is not None and len(ax_list) > 1:
         draw_gauge(ax_list[1], success_score, "Success Score", primary_color)
 
-    plt.tight_layout()
-    return _save_chart(fig, as_base64)
+    fig.tight_layout()
+    return _save_chart(fig, as_base64, return_bytes=return_bytes)
 
 
 def generate_timeline_chart(
@@ -404,7 +404,8 @@ def generate_timeline_chart(
     poc_end: Optional[date] = None,
     primary_color: str = "#0066cc",
     as_base64: bool = False,
-) -> Optional[str]:
+    return_bytes: bool = False,
+) -> Optional[Union[str, BytesIO]]:
     """Generate a Gantt-style timeline chart for tasks.
 
     Args:
@@ -413,6 +414,7 @@ def generate_timeline_chart(
         poc_end: POC end date
         primary_color: Tenant primary color
         as_base64: Return base64 if True
+        return_bytes: Return an in-memory PNG (BytesIO) instead
 
     Returns:
         File path or base64 string, or None if no schedulable tasks
@@ -442,7 +444,8 @@ def generate_timeline_chart(
 
     n = len(schedulable)
     fig_height = max(3, n * 0.5 + 2)
-    fig, ax = plt.subplots(1, 1, figsize=(9, fig_height))
+    fig = Figure(figsize=(9, fig_height))
+    ax = fig.subplots(1, 1)
     _apply_theme(fig, ax, primary_color)
 
     for i, task in enumerate(reversed(schedulable)):
@@ -539,15 +542,16 @@ def generate_timeline_chart(
     )
 
     ax.grid(axis="x", alpha=0.3, linestyle="--")
-    plt.tight_layout()
-    return _save_chart(fig, as_base64)
+    fig.tight_layout()
+    return _save_chart(fig, as_base64, return_bytes=return_bytes)
 
 
 def generate_workload_chart(
     assignee_data: Dict[str, Dict[str, int]],
     primary_color: str = "#0066cc",
     as_base64: bool = False,
-) -> Optional[str]:
+    return_bytes: bool = False,
+) -> Optional[Union[str, BytesIO]]:
     """Generate stacked bar chart showing workload per team member.
 
     Args:
@@ -555,6 +559,7 @@ def generate_workload_chart(
             e.g. {"John": {"completed": 3, "in_progress": 2, "not_started": 1}}
         primary_color: Tenant primary color
         as_base64: Return base64 if True
+        return_bytes: Return an in-memory PNG (BytesIO) instead
 
     Returns:
         File path or base64 string, or None if no data
@@ -567,7 +572,8 @@ def generate_workload_chart(
     n = len(names)
 
     fig_height = max(3, n * 0.6 + 1.5)
-    fig, ax = plt.subplots(1, 1, figsize=(7, fig_height))
+    fig = Figure(figsize=(7, fig_height))
+    ax = fig.subplots(1, 1)
     _apply_theme(fig, ax, primary_color)
 
     y_pos = np.arange(n)
@@ -617,21 +623,23 @@ def generate_workload_chart(
             color="#6B7280",
         )
 
-    plt.tight_layout()
-    return _save_chart(fig, as_base64)
+    fig.tight_layout()
+    return _save_chart(fig, as_base64, return_bytes=return_bytes)
 
 
 def generate_activity_chart(
     activity_data: List[Dict],
     primary_color: str = "#0066cc",
     as_base64: bool = False,
-) -> Optional[str]:
+    return_bytes: bool = False,
+) -> Optional[Union[str, BytesIO]]:
     """Generate bar chart showing comment/activity over time.
 
     Args:
         activity_data: List of dicts with keys: period (str), count (int)
         primary_color: Tenant primary color
         as_base64: Return base64 if True
+        return_bytes: Return an in-memory PNG (BytesIO) instead
 
     Returns:
         File path or base64 string, or None if no data
@@ -639,7 +647,8 @@ def generate_activity_chart(
     if not activity_data:
         return None
 
-    fig, ax = plt.subplots(1, 1, figsize=(7, 3.5))
+    fig = Figure(figsize=(7, 3.5))
+    ax = fig.subplots(1, 1)
     _apply_theme(fig, ax, primary_color)
 
     periods = [d["period"] for d in activity_data]
@@ -681,8 +690,8 @@ def generate_activity_chart(
     )
     ax.grid(axis="y", alpha=0.3, linestyle="--")
 
-    plt.tight_layout()
-    return _save_chart(fig, as_base64)
+    fig.tight_layout()
+    return _save_chart(fig, as_base64, return_bytes=return_bytes)
 
 
 def cleanup_chart_files(file_paths: List[str]):
@@ -15,6 +15,12 @@ engine = create_engine(TEST_DATABASE_URL)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def strict_report_loading(monkeypatch):
+    """Fail report tests on relationships the generator did not preload"""
+    monkeypatch.setattr(settings, "REPORT_STRICT_LOADING", True)
+
+
 @pytest.fixture(scope="function")
 def db_session():
     """Create a fresh database session for a test"""
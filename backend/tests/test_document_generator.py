@@ -0,0 +1,270 @@
+"""Tests for POC report generation"""
+
+import os
+import time
+from collections import Counter
+
+import pytest
+from sqlalchemy import event
+from datetime import date
+from app.config import settings
+from app.models.user import User, UserRole
+from app.models.tenant import Tenant
+from app.models.poc import POC, POCParticipant, POCStatus
+from app.models.task import (
+    Task,
+    TaskGroup,
+    POCTask,
+    POCTaskGroup,
+    POCTaskAssignee,
+    TaskStatus,
+)
+from app.models.comment import Comment
+from app.models.resource import Resource, ResourceType
+from app.models.success_criteria import SuccessCriteria, TaskSuccessCriteria
+from app.services import document_generator
+from app.services.document_generator import DocumentGenerator
+
+
+@pytest.fixture
+def report_poc(db_session):
+    """Create a POC with tasks, groups, assignees, criteria and comments"""
+    tenant = Tenant(name="Report Co", slug="report-co")
+    db_session.add(tenant)
+    db_session.flush()
+
+    user = User(
+        email="report@test.com",
+        full_name="Report Owner",
+        hashed_password="x",
+        role=UserRole.SALES_ENGINEER,
+        tenant_id=tenant.id,
+        is_active=True,
+    )
+    db_session.add(user)
+    db_session.flush()
+
+    poc = POC(
+        title="Report POC",
+        customer_company_name="Customer Corp",
+        tenant_id=tenant.id,
+        created_by=user.id,
+        status=POCStatus.ACTIVE,
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 3, 31),
+    )
+    db_session.add(poc)
+    db_session.flush()
+
+    participant = POCParticipant(
+        poc_id=poc.id, user_id=user.id, is_sales_engineer=True
+    )
+    criteria = SuccessCriteria(
+        poc_id=poc.id, title="Fast", target_value="10", is_met=True
+    )
+    template = Task(title="Template", tenant_id=tenant.id, created_by=user.id)
+    db_session.add_all([participant, criteria, template])
+    db_session.flush()
+
+    template_group = TaskGroup(
+        title="Group", tenant_id=tenant.id, created_by=user.id
+    )
+    template_group.tasks.append(template)
+    db_session.add(template_group)
+    db_session.flush()
+
+    group = POCTaskGroup(
+        poc_id=poc.id, task_group_id=template_group.id, title="Group"
+    )
+    task = POCTask(
+        poc_id=poc.id,
+        task_id=template.id,
+        title="Grouped task",
+        status=TaskStatus.IN_PROGRESS,
+        start_date=date(2026, 1, 5),
+        due_date=date(2026, 2, 1),
+    )
+    loose_task = POCTask(poc_id=poc.id, title="Loose task")
+    db_session.add_all([group, task, loose_task])
+    db_session.flush()
+
+    db_session.add_all(
+        [
+            POCTaskAssignee(
+                poc_task_id=task.id, participant_id=participant.id
+            ),
+            TaskSuccessCriteria(
+                success_criteria_id=criteria.id, poc_task_id=task.id
+            ),
+            Resource(
+                poc_id=poc.id,
+                poc_task_id=task.id,
+                title="Docs",
+                resource_type=ResourceType.LINK,
+                content="https://example.com",
+            ),
+            Comment(
+                subject="Task",
+                content="On the task",
+                user_id=user.id,
+                poc_id=poc.id,
+                poc_task_id=task.id,
+            ),
+            Comment(
+                subject="Group",
+                content="On the group",
+                guest_name="Guest",
+                poc_id=poc.id,
+                poc_task_group_id=group.id,
+            ),
+            Comment(
+                subject="POC",
+                content="On the POC",
+                user_id=user.id,
+                poc_id=poc.id,
+            ),
+        ]
+    )
+    db_session.commit()
+    return poc
+
+
+@pytest.mark.parametrize("fmt", ["pdf", "md", "docx"])
+def test_report_touches_only_preloaded_relationships(
+    db_session, report_poc, tmp_path, fmt
+):
+    """With REPORT_STRICT_LOADING the primed graph uses raiseload('*'), so
+    any relationship the report reads without eager-loading raises
+    InvalidRequestError and fails this test."""
+    assert settings.REPORT_STRICT_LOADING
+    generator = DocumentGenerator(db_session, report_poc)
+    output = tmp_path / f"report.{fmt}"
+
+    if fmt == "pdf":
+        generator.generate_pdf(str(output))
+    elif fmt == "md":
+        generator.generate_markdown(str(output))
+    else:
+        generator.generate_word(str(output))
+
+    assert output.stat().st_size > 0
+
+
+def test_report_loads_each_collection_once(db_session, report_poc, tmp_path):
+    """Every export format shares one load of the POC's collections"""
+    poc_id = report_poc.id
+    queries: Counter = Counter()
+
+    def count_select(state):
+        if state.is_select:
+            queries[state.all_mappers[0].local_table.name] += 1
+
+    event.listen(db_session, "do_orm_execute", count_select)
+    try:
+        generator = DocumentGenerator(db_session, report_poc)
+        generator.generate_pdf(str(tmp_path / "report.pdf"))
+        generator.generate_markdown(str(tmp_path / "report.md"))
+        generator.generate_word(str(tmp_path / "report.docx"))
+    finally:
+        event.remove(db_session, "do_orm_execute", count_select)
+
+    assert generator.poc.id == poc_id
+    assert queries == {
+        # The POC itself, then its products through the association.
+        "pocs": 2,
+        "success_criteria": 1,
+        "poc_tasks": 1,
+        "poc_task_groups": 1,
+        "poc_participants": 1,
+        "poc_task_assignees": 1,
+        "task_success_criteria": 1,
+        # POC, task and group resources.
+        "resources": 3,
+        # POC comments, then the latest per group and per task.
+        "comments": 3,
+        # Template groups, then their tasks through the association.
+        "task_groups": 2,
+    }
+
+
+def test_markdown_references_chart_files_unless_embedded(
+    db_session, report_poc, tmp_path
+):
+    """Charts are linked by path by default and inlined on request"""
+    linked = tmp_path / "linked.md"
+    DocumentGenerator(db_session, report_poc).generate_markdown(str(linked))
+    text = linked.read_text(encoding="utf-8")
+    assert "data:image/png;base64," not in text
+    src = text.split('<img src="', 1)[1].split('"', 1)[0]
+    assert src.endswith(".png") and os.path.exists(src)
+
+    embedded = tmp_path / "embedded.md"
+    DocumentGenerator(db_session, report_poc).generate_markdown(
+        str(embedded), embed_images=True
+    )
+    assert "data:image/png;base64," in embedded.read_text(encoding="utf-8")
+
+
+def test_pdf_escapes_markup_in_user_text(db_session, report_poc):
+    """User text containing markup characters renders instead of
+    breaking ReportLab's paragraph parser"""
+    report_poc.description = "Cost < budget & <b>unclosed"
+    db_session.commit()
+
+    pdf = DocumentGenerator(db_session, report_poc).generate_pdf_bytes()
+
+    assert pdf.startswith(b"%PDF")
+
+
+def test_chart_cache_prunes_least_recently_used(monkeypatch, tmp_path):
+    """Writing past the file limit evicts the oldest charts outside the
+    grace period"""
+    monkeypatch.setattr(document_generator, "_CHART_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(document_generator, "_CHART_CACHE_MAX_FILES", 2)
+    old = time.time() - document_generator._CHART_CACHE_GRACE_SECONDS - 60
+    for age, name in enumerate(["a.png", "b.png"]):
+        (tmp_path / name).write_bytes(b"png")
+        os.utime(tmp_path / name, (old + age, old + age))
+
+    document_generator._write_chart_cache(tmp_path / "c.png", b"png")
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["b.png", "c.png"]
+
+
+def test_pdf_keeps_dashboard_for_poc_without_children(db_session, report_poc):
+    """A POC with only a cover and overview still gets the executive
+    dashboard"""
+    poc = POC(
+        title="Bare POC",
+        customer_company_name="Customer Corp",
+        description="Short description",
+        tenant_id=report_poc.tenant_id,
+        created_by=report_poc.created_by,
+        status=POCStatus.ACTIVE,
+        overall_success_score=40,
+    )
+    db_session.add(poc)
+    db_session.commit()
+
+    pdf = DocumentGenerator(db_session, poc).generate_pdf_bytes()
+
+    # Page streams are stored uncompressed, so drawn text is searchable.
+    assert b"POC Overview" in pdf
+    assert b"Executive Dashboard" in pdf
+    assert b"40/100" in pdf
+
+
+def test_chart_cache_is_private_and_per_tenant(monkeypatch, tmp_path):
+    """Each tenant gets its own directory under a root only this user can
+    write; a shared root is refused"""
+    root = tmp_path / "charts"
+    monkeypatch.setattr(document_generator, "_CHART_CACHE_DIR", root)
+
+    path = document_generator._chart_cache_dir(7)
+
+    assert path == root / "7"
+    assert root.stat().st_mode & 0o777 == 0o700
+
+    root.chmod(0o777)
+    with pytest.raises(PermissionError):
+        document_generator._chart_cache_dir(7)
@@ -0,0 +1,219 @@
+"""Tests for email rendering and delivery"""
+
+import asyncio
+from email.utils import parseaddr
+
+from aiosmtplib import SMTPRecipientsRefused
+
+from app.services import email as email_service
+from app.services.email import _poc_invitation_message
+
+
+def test_poc_invitation_escapes_user_text():
+    """Names, titles and personal messages are HTML-escaped"""
+    message = _poc_invitation_message(
+        recipient="guest@test.com",
+        full_name="<b>Guest</b>",
+        poc_title="R&D POC",
+        token="abc",
+        invited_by_name="Owner",
+        personal_message='"><script>alert(1)</script>',
+    )
+
+    assert "<script>" not in message.body
+    assert "&lt;b&gt;Guest&lt;/b&gt;" in message.body
+    assert "R&amp;D POC" in message.body
+
+
+def test_poc_invitation_omits_empty_personal_message():
+    """The personal message block only renders when a message is given"""
+    message = _poc_invitation_message(
+        recipient="guest@test.com",
+        full_name="Guest",
+        poc_title="POC",
+        token="abc",
+        invited_by_name="Owner",
+    )
+
+    assert "font-style: italic" not in message.body
+    assert "/poc-invitation?token=abc" in message.body
+
+
+class _FakeSMTP:
+    """SMTP session that rejects one address"""
+
+    def __init__(self, rejected=None):
+        self.rejected = rejected
+        self.sent = []
+        self.messages = []
+
+    async def send_message(self, message, recipients=None):
+        self.messages.append((message, recipients))
+        address = parseaddr(message["To"])[1]
+        if address == self.rejected:
+            raise SMTPRecipientsRefused([])
+        self.sent.append(address)
+
+
+class _FakeConnection:
+    """Stands in for fastapi_mail's Connection around a _FakeSMTP"""
+
+    session = None
+
+    def __init__(self, config):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+
+def _invitation(recipient, **extra):
+    return {
+        "recipient": recipient,
+        "full_name": "Guest",
+        "poc_title": "POC",
+        "token": "abc",
+        "invited_by_name": "Owner",
+        **extra,
+    }
+
+
+def test_send_emails_isolates_rejected_recipient(monkeypatch):
+    """A refused message does not stop the rest of the batch"""
+    smtp = _FakeSMTP("bad@test.com")
+    monkeypatch.setattr(_FakeConnection, "session", smtp)
+    monkeypatch.setattr(email_service, "Connection", _FakeConnection)
+    messages = [
+        _poc_invitation_message(**_invitation(r))
+        for r in ["a@test.com", "bad@test.com", "b@test.com"]
+    ]
+
+    errors = asyncio.run(email_service.send_emails(messages))
+
+    assert smtp.sent == ["a@test.com", "b@test.com"]
+    assert errors[0] is None and errors[2] is None
+    assert isinstance(errors[1], SMTPRecipientsRefused)
+
+
+def test_invitation_batch_records_each_outcome(monkeypatch):
+    """Each invitation gets its own delivery status"""
+    recorded = {}
+
+    async def fake_send_emails(messages, tenant=None):
+        return [None, SMTPRecipientsRefused([])]
+
+    monkeypatch.setattr(email_service, "send_emails", fake_send_emails)
+    monkeypatch.setattr(
+        email_service, "_record_invitation_delivery", recorded.update
+    )
+
+    asyncio.run(
+        email_service.send_poc_invitations_batch(
+            [
+                _invitation("a@test.com", invitation_id=1),
+                _invitation("bad@test.com", invitation_id=2),
+            ]
+        )
+    )
+
+    assert recorded == {1: True, 2: False}
+
+
+def test_invitation_batch_marks_all_failed_without_session(monkeypatch):
+    """If the SMTP session cannot open, every invitation is failed"""
+    recorded = {}
+
+    async def fake_send_emails(messages, tenant=None):
+        raise ConnectionError("refused")
+
+    monkeypatch.setattr(email_service, "send_emails", fake_send_emails)
+    monkeypatch.setattr(
+        email_service, "_record_invitation_delivery", recorded.update
+    )
+
+    asyncio.run(
+        email_service.send_poc_invitations_batch(
+            [
+                _invitation("a@test.com", invitation_id=1),
+                _invitation("b@test.com", invitation_id=2),
+            ]
+        )
+    )
+
+    assert recorded == {1: False, 2: False}
+
+
+def test_admin_notification_reaches_remaining_admins(monkeypatch):
+    """One refused admin address does not drop the others"""
+    smtp = _FakeSMTP("bad@test.com")
+    monkeypatch.setattr(_FakeConnection, "session", smtp)
+    monkeypatch.setattr(email_service, "Connection", _FakeConnection)
+
+    delivered = asyncio.run(
+        email_service.send_demo_conversion_request_email(
+            ["bad@test.com", "a@test.com", "b@test.com"],
+            tenant_name="Acme",
+            requested_by_name="Owner",
+            requested_by_email="owner@test.com",
+            reason="Ready to buy",
+            request_id=1,
+        )
+    )
+
+    assert delivered is False
+    assert smtp.sent == ["a@test.com", "b@test.com"]
+
+
+def test_broadcast_names_undisclosed_recipients(monkeypatch):
+    """Bcc broadcasts carry a group To header and a bare-address
+    envelope"""
+    smtp = _FakeSMTP()
+    monkeypatch.setattr(_FakeConnection, "session", smtp)
+    monkeypatch.setattr(email_service, "Connection", _FakeConnection)
+
+    asyncio.run(
+        email_service.send_broadcast(
+            ["a@test.com", "b@test.com"], "Update", "Body"
+        )
+    )
+
+    ((message, envelope),) = smtp.messages
+    assert message["To"] == "undisclosed-recipients:;"
+    assert envelope == ["a@test.com", "b@test.com"]
+
+
+def test_send_emails_reaches_fastapi_mail_outbox(monkeypatch):
+    """With SUPPRESS_SEND the real session is skipped and every message
+    lands in FastMail.record_messages()"""
+    config = email_service.get_mail_config().model_copy(
+        update={"SUPPRESS_SEND": 1}
+    )
+    monkeypatch.setattr(
+        email_service, "get_mail_config", lambda t=None: config
+    )
+    monkeypatch.setattr(email_service, "_MAIL_CLIENTS", {})
+
+    fm = email_service._get_fastmail()
+    with fm.record_messages() as outbox:
+        asyncio.run(
+            email_service.send_broadcast(
+                ["a@test.com", "b@test.com"], "Update", "Body"
+            )
+        )
+        asyncio.run(
+            email_service.send_demo_conversion_request_email(
+                ["admin@test.com"],
+                tenant_name="Acme",
+                requested_by_name="Owner",
+                requested_by_email="owner@test.com",
+                reason="Ready to buy",
+                request_id=1,
+            )
+        )
+
+    assert len(outbox) == 2
+    assert outbox[0]["To"] == "undisclosed-recipients:;"
+    assert parseaddr(outbox[1]["To"])[1] == "admin@test.com"